@@ -8,80 +8,15 @@ Uses Claude AI to analyze Zendesk ticket conversations and generate:
 """
 
 import os
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 from anthropic import Anthropic
+from claude_response_parser import split_summary_description
 
 
-class ClaudeAnalyzer:
-    """Analyzes Zendesk tickets using Claude AI to generate Jira content."""
-
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize Claude analyzer.
-
-        Args:
-            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
-        """
-        self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
-        if not self.api_key:
-            raise ValueError(
-                "Anthropic API key required. Set ANTHROPIC_API_KEY environment variable "
-                "or pass api_key parameter."
-            )
-
-        self.client = Anthropic(api_key=self.api_key)
-        self.model = "claude-sonnet-4-20250514"  # Latest Sonnet model
-
-    def analyze_zendesk_ticket(
-        self,
-        zendesk_conversation: str,
-        ticket_id: str,
-        customer: str = "Unknown",
-        product: str = "Redis Software"
-    ) -> Tuple[str, str]:
-        """
-        Analyze Zendesk ticket and generate Jira summary + description.
-
-        Args:
-            zendesk_conversation: Full Zendesk ticket conversation text
-            ticket_id: Zendesk ticket ID
-            customer: Customer name
-            product: Product name (e.g., "Redis Software", "Redis Cloud")
-
-        Returns:
-            Tuple of (summary, description)
-        """
-        prompt = self._build_analysis_prompt(
-            zendesk_conversation,
-            ticket_id,
-            customer,
-            product
-        )
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=8000,
-            temperature=0,  # Deterministic for consistency
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-
-        # Parse response to extract summary and description
-        return self._parse_response(response.content[0].text)
-
-    def _build_analysis_prompt(
-        self,
-        conversation: str,
-        ticket_id: str,
-        customer: str,
-        product: str
-    ) -> str:
-        """Build the analysis prompt for Claude."""
-        return f"""You are analyzing a Zendesk support ticket to create a Jira bug report for {product} engineering team.
+# Analysis prompt, built once at import and rendered per ticket with
+# str.format_map (placeholders: conversation, ticket_id, customer, product)
+ANALYSIS_PROMPT_TEMPLATE = """You are analyzing a Zendesk support ticket to create a Jira bug report for {product} engineering team.
 
 **Zendesk Ticket #{ticket_id}**
 **Customer:** {customer}
@@ -179,6 +114,131 @@ DESCRIPTION:
 [structured description here]
 """
 
+# Message Batches API polling (batches usually finish within minutes, max 24h)
+BATCH_POLL_INTERVAL = 10  # seconds
+
+
+class ClaudeAnalyzer:
+    """Analyzes Zendesk tickets using Claude AI to generate Jira content."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize Claude analyzer.
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+        """
+        self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        if not self.api_key:
+            raise ValueError(
+                "Anthropic API key required. Set ANTHROPIC_API_KEY environment variable "
+                "or pass api_key parameter."
+            )
+
+        self.client = Anthropic(api_key=self.api_key)
+        self.model = "claude-sonnet-4-20250514"  # Latest Sonnet model
+
+    def analyze_zendesk_ticket(
+        self,
+        zendesk_conversation: str,
+        ticket_id: str,
+        customer: str = "Unknown",
+        product: str = "Redis Software"
+    ) -> Tuple[str, str]:
+        """
+        Analyze Zendesk ticket and generate Jira summary + description.
+
+        Args:
+            zendesk_conversation: Full Zendesk ticket conversation text
+            ticket_id: Zendesk ticket ID
+            customer: Customer name
+            product: Product name (e.g., "Redis Software", "Redis Cloud")
+
+        Returns:
+            Tuple of (summary, description)
+        """
+        prompt = self._build_analysis_prompt(
+            zendesk_conversation,
+            ticket_id,
+            customer,
+            product
+        )
+
+        response = self.client.messages.create(**self._message_params(prompt))
+
+        # Parse response to extract summary and description
+        return self._parse_response(response.content[0].text)
+
+    def analyze_zendesk_tickets(self, tickets: List[Dict]) -> List[Optional[Tuple[str, str]]]:
+        """
+        Analyze several Zendesk tickets in one Message Batches API request.
+
+        Batched requests are billed at half the price of individual calls, at the
+        cost of latency (results are polled until the whole batch has ended).
+
+        Args:
+            tickets: List of dicts with the analyze_zendesk_ticket keyword arguments
+                     (zendesk_conversation, ticket_id, customer, product)
+
+        Returns:
+            List of (summary, description) in the same order as tickets,
+            with None for tickets whose request did not succeed
+        """
+        requests = [
+            {
+                "custom_id": f"ticket-{index}",
+                "params": self._message_params(self._build_analysis_prompt(
+                    ticket['zendesk_conversation'],
+                    ticket['ticket_id'],
+                    ticket.get('customer', 'Unknown'),
+                    ticket.get('product', 'Redis Software')
+                ))
+            }
+            for index, ticket in enumerate(tickets)
+        ]
+
+        batch = self.client.messages.batches.create(requests=requests)
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results: List[Optional[Tuple[str, str]]] = [None] * len(tickets)
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                index = int(entry.custom_id.rsplit('-', 1)[1])
+                results[index] = self._parse_response(entry.result.message.content[0].text)
+
+        return results
+
+    def _message_params(self, prompt: str) -> Dict:
+        """Build the Messages API parameters for one analysis prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": 8000,
+            "temperature": 0,  # Deterministic for consistency
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _build_analysis_prompt(
+        self,
+        conversation: str,
+        ticket_id: str,
+        customer: str,
+        product: str
+    ) -> str:
+        """Build the analysis prompt for Claude."""
+        return ANALYSIS_PROMPT_TEMPLATE.format_map({
+            'conversation': conversation,
+            'ticket_id': ticket_id,
+            'customer': customer,
+            'product': product,
+        })
+
     def _parse_response(self, response_text: str) -> Tuple[str, str]:
         """
         Parse Claude's response to extract summary and description.
@@ -189,23 +249,7 @@ DESCRIPTION:
         Returns:
             Tuple of (summary, description)
         """
-        lines = response_text.strip().split('\n')
-
-        summary = ""
-        description = ""
-        in_description = False
-
-        for line in lines:
-            if line.startswith("SUMMARY:"):
-                summary = line.replace("SUMMARY:", "").strip()
-            elif line.startswith("DESCRIPTION:"):
-                in_description = True
-                continue
-            elif in_description:
-                description += line + "\n"
-
-        # Clean up description
-        description = description.strip()
+        summary, description = split_summary_description(response_text.strip())
 
         # Fallback if parsing fails
         if not summary:
@@ -7,6 +7,8 @@ to analyze Zendesk tickets interactively, without requiring Anthropic API access
 
 Usage:
     python3 src/claude_interactive.py redislabs.zendesk.com_tickets_149320_print.pdf
+    python3 src/claude_interactive.py ticket.pdf --no-show-prompt
+    python3 src/claude_interactive.py --batch zendesk_pdfs/
 
 This will:
 1. Parse the Zendesk PDF
@@ -15,27 +17,23 @@ This will:
 4. Save Claude's response to create the Jira ticket
 """
 
+import io
 import sys
+import shutil
 import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from collections import Counter
+from typing import Dict, List, Optional, TextIO, Union
 from universal_ticket_parser import UniversalTicketParser
+# parse_claude_response lives in claude_response_parser; kept importable from here
+from claude_response_parser import parse_claude_response
 
 
-def generate_analysis_prompt(zendesk_data: dict, ticket_id: str, customer: str = "Unknown") -> str:
-    """
-    Generate the prompt for Claude Code analysis.
-
-    Args:
-        zendesk_data: Parsed Zendesk ticket data
-        ticket_id: Zendesk ticket ID
-        customer: Customer name
-
-    Returns:
-        Formatted prompt string for Claude
-    """
-    conversation = zendesk_data.get('description', '')
-
-    prompt = f"""I need you to analyze this Zendesk support ticket and create a Jira bug report.
+# Analysis prompt, built once at import and rendered per ticket with
+# str.format_map (placeholders: ticket_id, customer, conversation)
+ANALYSIS_PROMPT_TEMPLATE = """I need you to analyze this Zendesk support ticket and create a Jira bug report.
 
 **Zendesk Ticket #{ticket_id}**
 **Customer:** {customer}
@@ -171,7 +169,38 @@ DESCRIPTION:
 [structured description here]
 ```
 """
-    return prompt
+
+# Split around the conversation so the (potentially large) ticket text can be
+# written straight to the output file instead of being copied into the prompt
+_PROMPT_HEAD, _PROMPT_TAIL = ANALYSIS_PROMPT_TEMPLATE.split('{conversation}')
+
+# Console banners
+_EQ = "=" * 80
+
+
+def generate_analysis_prompt(zendesk_data: dict, ticket_id: str, customer: str = "Unknown",
+                             out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Generate the prompt for Claude Code analysis.
+
+    Args:
+        zendesk_data: Parsed Zendesk ticket data
+        ticket_id: Zendesk ticket ID
+        customer: Customer name
+        out: Optional file-like object to write the prompt to incrementally
+
+    Returns:
+        Formatted prompt string for Claude, or None when written to `out`
+    """
+    if out is None:
+        buffer = io.StringIO()
+        generate_analysis_prompt(zendesk_data, ticket_id, customer, out=buffer)
+        return buffer.getvalue()
+
+    out.write(_PROMPT_HEAD.format_map({'ticket_id': ticket_id, 'customer': customer}))
+    out.write(zendesk_data.get('description', ''))
+    out.write(_PROMPT_TAIL)
+    return None
 
 
 def save_response_template(output_file: Path, ticket_id: str):
@@ -186,129 +215,259 @@ SUMMARY:
 DESCRIPTION:
 
 """
-    with open(output_file, 'w') as f:
-        f.write(template)
+    output_file.write_text(template)
 
     return output_file
 
 
-def parse_claude_response(response_file: Path) -> tuple[str, str]:
+def process_zendesk_pdf(pdf_path: Union[str, Path], output_dir: Union[str, Path] = 'output') -> Dict:
     """
-    Parse Claude's response from the saved file.
+    Parse a Zendesk PDF and write its Claude prompt and response template.
+
+    Module-level so --batch can run it in worker processes.
 
     Returns:
-        Tuple of (summary, description)
+        Dict with ticket_id, customer, file_id, prompt_file and response_file
     """
-    with open(response_file, 'r') as f:
-        content = f.read()
-
-    # Find the separator line
-    if '---' in content:
-        content = content.split('---', 1)[1].strip()
-
-    lines = content.split('\n')
-    summary = ""
-    description = ""
-    in_description = False
-
-    for line in lines:
-        if line.startswith("SUMMARY:"):
-            summary = line.replace("SUMMARY:", "").strip()
-        elif line.startswith("DESCRIPTION:"):
-            in_description = True
-            continue
-        elif in_description:
-            description += line + "\n"
+    return write_prompt_files(_parse_zendesk_pdf(pdf_path), pdf_path, output_dir)
 
-    return summary.strip(), description.strip()
 
+def _parse_zendesk_pdf(pdf_path: Union[str, Path]) -> Dict:
+    """Parse one Zendesk PDF (process pool worker for --batch)."""
+    with UniversalTicketParser(pdf_path) as parser:
+        return parser.parse()
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 src/claude_interactive.py <zendesk_pdf_path>")
+
+def write_prompt_files(zendesk_data: Dict, pdf_path: Union[str, Path],
+                       output_dir: Union[str, Path] = 'output',
+                       file_id: Optional[str] = None) -> Dict:
+    """
+    Write the Claude prompt and response template for a parsed Zendesk PDF.
+
+    Args:
+        zendesk_data: Parsed Zendesk ticket data
+        pdf_path: The PDF it was parsed from
+        output_dir: Directory for claude_prompt_<file_id>.txt and claude_response_<file_id>.txt
+        file_id: Name for the output files (defaults to the ticket ID, or the
+                 PDF file name when the ticket ID could not be parsed)
+
+    Returns:
+        Dict with ticket_id, customer, file_id, prompt_file and response_file
+    """
+    ticket_id = zendesk_data.get('ticket_id') or 'Unknown'
+    customer = zendesk_data.get('customer_name', 'Unknown')
+    if file_id is None:
+        file_id = ticket_id if ticket_id != 'Unknown' else Path(pdf_path).stem
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(exist_ok=True)
+
+    # Write prompt straight to file
+    prompt_file = output_dir / f"claude_prompt_{file_id}.txt"
+    with open(prompt_file, 'w') as f:
+        generate_analysis_prompt(zendesk_data, ticket_id, customer, out=f)
+
+    # Create response template
+    response_file = output_dir / f"claude_response_{file_id}.txt"
+    save_response_template(response_file, ticket_id)
+
+    return {
+        'ticket_id': ticket_id,
+        'customer': customer,
+        'file_id': file_id,
+        'prompt_file': prompt_file,
+        'response_file': response_file,
+    }
+
+
+def _batch_file_ids(pdf_files: List[Path], ticket_ids: List[str]) -> List[str]:
+    """
+    Pick a distinct output file name for every PDF in a batch.
+
+    The ticket ID is used when only one PDF has it. A PDF without a ticket ID
+    is named after the PDF file, and PDFs sharing a ticket ID get the PDF file
+    name as a suffix, so no two PDFs write the same prompt/response files.
+    """
+    counts = Counter(ticket_ids)
+    file_ids = []
+    for pdf_file, ticket_id in zip(pdf_files, ticket_ids):
+        if ticket_id == 'Unknown':
+            file_ids.append(pdf_file.stem)
+        elif counts[ticket_id] > 1:
+            file_ids.append(f"{ticket_id}_{pdf_file.stem}")
+        else:
+            file_ids.append(ticket_id)
+    return file_ids
+
+
+def process_batch(batch_dir: Union[str, Path]):
+    """Generate prompts for every PDF in a directory, one worker process per core."""
+    pdf_files = sorted(Path(batch_dir).glob('*.pdf'))
+    if not pdf_files:
+        print(f"Error: No PDF files found in {batch_dir}")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
+    print(_EQ)
+    print("CLAUDE INTERACTIVE MODE - Batch Zendesk to Jira Analysis")
+    print(_EQ)
+    print(f"Input: {batch_dir} ({len(pdf_files)} PDFs)")
+    print()
+
+    # Parse in parallel, then name and write the files here once all ticket
+    # IDs are known, so PDFs with a missing or shared ID can't overwrite
+    # each other's prompts
+    failed = 0
+    parsed = []
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_parse_zendesk_pdf, pdf_file) for pdf_file in pdf_files]
+        for pdf_file, future in zip(pdf_files, futures):
+            try:
+                parsed.append((pdf_file, future.result()))
+            except Exception as e:
+                failed += 1
+                print(f"✗ {pdf_file.name}: {e}")
+
+    ticket_ids = [zendesk_data.get('ticket_id') or 'Unknown' for _, zendesk_data in parsed]
+    file_ids = _batch_file_ids([pdf_file for pdf_file, _ in parsed], ticket_ids)
+    counts = Counter(ticket_ids)
+
+    renamed = 0
+    for (pdf_file, zendesk_data), ticket_id, file_id in zip(parsed, ticket_ids, file_ids):
+        try:
+            result = write_prompt_files(zendesk_data, pdf_file, file_id=file_id)
+        except Exception as e:
+            failed += 1
+            print(f"✗ {pdf_file.name}: {e}")
+            continue
+        if file_id == ticket_id:
+            print(f"✓ {pdf_file.name}: #{ticket_id} -> {result['prompt_file']}")
+            continue
+        renamed += 1
+        if ticket_id == 'Unknown':
+            reason = "no ticket ID found"
+        else:
+            reason = f"ticket #{ticket_id} is in {counts[ticket_id]} PDFs"
+        print(f"⚠ {pdf_file.name}: {reason}, named after the PDF -> {result['prompt_file']}")
+
+    print()
+    print(f"Generated {len(pdf_files) - failed - renamed}/{len(pdf_files)} prompts by ticket ID.")
+    if renamed:
+        print(f"⚠ {renamed} PDFs had a missing or duplicate ticket ID; their prompts are named after the PDF file.")
+    print("Paste each prompt into Claude, save the reply to the matching")
+    print("claude_response_<ticket_id>.txt (or _<pdf name>) and run create_jira_from_claude_response.py on it.")
+
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description='Generate a Claude analysis prompt from a Zendesk PDF',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s redislabs.zendesk.com_tickets_149320_print.pdf
+  %(prog)s ticket.pdf --show-prompt
+  %(prog)s ticket.pdf --no-show-prompt
+  %(prog)s --batch zendesk_pdfs/
+        """
+    )
+
+    arg_parser.add_argument(
+        'zendesk_pdf',
+        nargs='?',
+        help='Path to Zendesk PDF'
+    )
+
+    arg_parser.add_argument(
+        '--batch',
+        metavar='DIR',
+        help='Generate prompts for every *.pdf in DIR (processed in parallel)'
+    )
+
+    arg_parser.add_argument(
+        '--show-prompt',
+        dest='show_prompt',
+        action='store_true',
+        default=None,
+        help='Print the generated prompt (default: only when stdout is a terminal)'
+    )
+
+    arg_parser.add_argument(
+        '--no-show-prompt',
+        dest='show_prompt',
+        action='store_false',
+        help='Do not print the generated prompt'
+    )
+
+    args = arg_parser.parse_args()
+    show_prompt = sys.stdout.isatty() if args.show_prompt is None else args.show_prompt
+
+    if args.batch:
+        process_batch(args.batch)
+        return
+
+    if not args.zendesk_pdf:
+        arg_parser.error("a Zendesk PDF path or --batch DIR is required")
+
+    pdf_path = args.zendesk_pdf
 
     if not Path(pdf_path).exists():
         print(f"Error: File not found: {pdf_path}")
         sys.exit(1)
 
-    print("="*80)
+    print(_EQ)
     print("CLAUDE INTERACTIVE MODE - Zendesk to Jira Analysis")
-    print("="*80)
+    print(_EQ)
     print(f"Input: {pdf_path}")
     print()
 
-    # Parse Zendesk ticket
-    print("Parsing Zendesk ticket...")
-    parser = UniversalTicketParser(pdf_path)
-    zendesk_data = parser.parse()
-    ticket_id = zendesk_data.get('ticket_id', 'Unknown')
-    customer = zendesk_data.get('customer_name', 'Unknown')
+    # Parse Zendesk ticket and write the prompt and response template
+    print("Parsing Zendesk ticket and generating Claude analysis prompt...")
+    result = process_zendesk_pdf(pdf_path)
+    prompt_file = result['prompt_file']
+    response_file = result['response_file']
 
-    print(f"✓ Ticket ID: {ticket_id}")
-    print(f"✓ Customer: {customer}")
+    print(f"✓ Ticket ID: {result['ticket_id']}")
+    print(f"✓ Customer: {result['customer']}")
+    print(f"✓ Prompt saved to: {prompt_file}")
+    print(f"✓ Response template saved to: {response_file}")
     print()
 
-    # Generate prompt
-    print("Generating Claude analysis prompt...")
-    prompt = generate_analysis_prompt(zendesk_data, ticket_id, customer)
-
-    # Save prompt to file
-    output_dir = Path('output')
-    output_dir.mkdir(exist_ok=True)
+    sys.stdout.write(f"""{_EQ}
+NEXT STEPS
+{_EQ}
 
-    prompt_file = output_dir / f"claude_prompt_{ticket_id}.txt"
-    with open(prompt_file, 'w') as f:
-        f.write(prompt)
+OPTION 1 - Copy/Paste in Claude Code:
+  1. Copy the content from:
+     {prompt_file}
+  2. Paste it into Claude Code (this chat)
+  3. Claude will analyze and respond
+  4. Copy Claude's response to:
+     {response_file}
+  5. Run: python3 src/create_jira_from_claude_response.py {response_file}
 
-    print(f"✓ Prompt saved to: {prompt_file}")
-    print()
+OPTION 2 - Direct prompt display:
+  Run: cat {prompt_file}
+  Then paste the output into this chat
 
-    # Create response template
-    response_file = output_dir / f"claude_response_{ticket_id}.txt"
-    save_response_template(response_file, ticket_id)
-    print(f"✓ Response template saved to: {response_file}")
-    print()
+{_EQ}
 
-    print("="*80)
-    print("NEXT STEPS")
-    print("="*80)
-    print()
-    print("OPTION 1 - Copy/Paste in Claude Code:")
-    print("  1. Copy the content from:")
-    print(f"     {prompt_file}")
-    print("  2. Paste it into Claude Code (this chat)")
-    print("  3. Claude will analyze and respond")
-    print("  4. Copy Claude's response to:")
-    print(f"     {response_file}")
-    print("  5. Run: python3 src/create_jira_from_claude_response.py {response_file}")
-    print()
-    print("OPTION 2 - Direct prompt display:")
-    print("  Run: cat", prompt_file)
-    print("  Then paste the output into this chat")
-    print()
-    print("="*80)
-    print()
+""")
 
-    # Ask if they want to see the prompt now
-    print("Would you like to see the prompt now? (y/n): ", end='')
-    try:
-        choice = input().strip().lower()
-        if choice == 'y':
-            print()
-            print("="*80)
-            print("CLAUDE ANALYSIS PROMPT")
-            print("="*80)
-            print()
-            print(prompt)
-            print()
-            print("="*80)
-    except (EOFError, KeyboardInterrupt):
+    if show_prompt:
+        print(_EQ)
+        print("CLAUDE ANALYSIS PROMPT")
+        print(_EQ)
+        print()
+        sys.stdout.flush()
+        with open(prompt_file) as f:
+            shutil.copyfileobj(f, sys.stdout)
+        print()
+        print()
+        print(_EQ)
         print()
 
-    print()
     print("Prompt saved. You can now paste it into Claude Code for analysis.")
 
 
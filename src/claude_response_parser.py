@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Claude Response Parser
+
+Parses the response Claude returns in the interactive workflow
+(claude_interactive.py -> create_jira_from_claude_response.py) into a
+Jira summary and description.
+
+Expected response layout:
+    <optional header>
+    ---
+    SUMMARY: <one-line summary>
+
+    DESCRIPTION:
+    <structured description>
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple, Union
+
+
+# Claude response layout: a "SUMMARY: <title>" line followed by a
+# "DESCRIPTION:" line and the description body
+SUMMARY_PATTERN = re.compile(r'^SUMMARY:[ \t]*(.*)$', re.MULTILINE)
+DESCRIPTION_PATTERN = re.compile(r'^DESCRIPTION:[^\n]*\n?(.*)', re.MULTILINE | re.DOTALL)
+
+# Metadata lines Claude may append to the description body
+METADATA_LINE_PATTERN = re.compile(r'^(?:LABELS|IMPACT_SCORE):.*\n?', re.MULTILINE)
+
+
+def parse_claude_response(response_file: Union[str, Path]) -> Tuple[str, str]:
+    """
+    Parse Claude's response from the saved file.
+
+    Results are cached per file path and modification time, so re-parsing an
+    unchanged response file in the same process is free.
+
+    Returns:
+        Tuple of (summary, description)
+    """
+    response_file = Path(response_file)
+    summary, description, content = _parse_response_file(
+        str(response_file), response_file.stat().st_mtime_ns
+    )
+
+    # Fallback if parsing failed
+    if not summary:
+        print("⚠ Warning: Could not parse SUMMARY from response file")
+        summary = "Unable to parse summary from Claude response"
+
+    if not description:
+        print("⚠ Warning: Could not parse DESCRIPTION from response file")
+        description = content  # Use entire content as fallback
+
+    return summary, description
+
+
+@lru_cache(maxsize=8)
+def _parse_response_file(path: str, mtime_ns: int) -> Tuple[str, str, str]:
+    """Parse a response file into (summary, description, content); keyed on mtime."""
+    content = Path(path).read_text()
+
+    # Drop the header above the separator if present (only the FIRST --- counts,
+    # later ones are markdown rules inside the description)
+    _, separator, body = content.partition('---')
+    if separator:
+        content = body.strip()
+
+    summary, description = split_summary_description(content)
+    return summary, description, content
+
+
+def split_summary_description(text: str) -> Tuple[str, str]:
+    """
+    Extract the SUMMARY line and DESCRIPTION body from Claude's response text.
+
+    LABELS: and IMPACT_SCORE: lines are removed from the description.
+    Either value is an empty string if its marker is missing.
+    """
+    summary_match = SUMMARY_PATTERN.search(text)
+    summary = summary_match.group(1).strip() if summary_match else ""
+
+    description_match = DESCRIPTION_PATTERN.search(text)
+    description = description_match.group(1) if description_match else ""
+
+    # Remove LABELS: and IMPACT_SCORE: lines (should be at the end, not in description body)
+    description = METADATA_LINE_PATTERN.sub('', description).strip()
+
+    return summary, description
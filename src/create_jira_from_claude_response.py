@@ -12,67 +12,44 @@ Usage:
 
 import sys
 import argparse
+import bisect
 import json
 from pathlib import Path
-from jira_creator import JiraCreator, JiraTicketData
-from intelligent_estimator import IntelligentImpactEstimator
-from label_extractor import extract_labels
-
-
-def parse_claude_response(response_file: Path) -> tuple[str, str]:
-    """
-    Parse Claude's response from the saved file.
-
-    Returns:
-        Tuple of (summary, description)
-    """
-    with open(response_file, 'r') as f:
-        content = f.read()
-
-    # Find the separator line if present (only split on FIRST ---)
-    if '---' in content:
-        parts = content.split('---', 1)  # maxsplit=1 to only split on first occurrence
-        if len(parts) > 1:
-            content = parts[1].strip()
-
-    lines = content.split('\n')
-    summary = ""
-    description = ""
-    in_description = False
-
-    for line in lines:
-        if line.startswith("SUMMARY:"):
-            summary = line.replace("SUMMARY:", "").strip()
-        elif line.startswith("DESCRIPTION:"):
-            in_description = True
-            continue
-        elif in_description:
-            description += line + "\n"
-
-    # Clean up
-    summary = summary.strip()
-    description = description.strip()
-
-    # Remove LABELS: line from description (should be at the end, not in description body)
-    description_lines = description.split('\n')
-    cleaned_lines = []
-    for line in description_lines:
-        # Skip LABELS: line and IMPACT_SCORE: line
-        if line.startswith('LABELS:') or line.startswith('IMPACT_SCORE:'):
-            continue
-        cleaned_lines.append(line)
-    description = '\n'.join(cleaned_lines).strip()
-
-    # Fallback if parsing failed
-    if not summary:
-        print("⚠ Warning: Could not parse SUMMARY from response file")
-        summary = "Unable to parse summary from Claude response"
-
-    if not description:
-        print("⚠ Warning: Could not parse DESCRIPTION from response file")
-        description = content  # Use entire content as fallback
-
-    return summary, description
+from claude_response_parser import parse_claude_response
+
+# Optional: faster JSON serialization (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# jira_creator, intelligent_estimator and universal_ticket_parser pull in the
+# PDF/pandas stack, so they are imported inside main() only where needed
+
+# Valid --project / --format values
+JIRA_PROJECTS = ('RED', 'MOD', 'DOC', 'RDSC')
+OUTPUT_FORMATS = ('json', 'markdown', 'both')
+
+# Impact score thresholds and the priority for each band (< 30, 30-49, ..., >= 90)
+PRIORITY_THRESHOLDS = (30, 50, 70, 90)
+PRIORITY_LEVELS = ('Lowest', 'Low', 'Medium', 'High', 'Highest')
+
+# Console banners
+_EQ = "=" * 80
+_DASH = "-" * 80
+
+NEXT_STEPS = f"""
+{_EQ}
+NEXT STEPS
+{_EQ}
+1. Review the generated markdown file
+2. Copy and paste the markdown content into Jira
+3. Verify all fields are correctly populated
+4. Link any related tickets as needed
+
+{_EQ}
+"""
 
 
 def main():
@@ -99,7 +76,7 @@ Examples:
 
     parser.add_argument(
         '--project',
-        choices=['RED', 'MOD', 'DOC', 'RDSC'],
+        choices=JIRA_PROJECTS,
         default='RED',
         help='Jira project for the ticket (default: RED)'
     )
@@ -111,7 +88,7 @@ Examples:
 
     parser.add_argument(
         '--format',
-        choices=['json', 'markdown', 'both'],
+        choices=OUTPUT_FORMATS,
         default='markdown',
         help='Output format (default: markdown)'
     )
@@ -124,9 +101,9 @@ Examples:
         print(f"Error: Response file not found: {args.response_file}")
         sys.exit(1)
 
-    print("="*80)
+    print(_EQ)
     print("CREATE JIRA FROM CLAUDE RESPONSE")
-    print("="*80)
+    print(_EQ)
     print(f"Response file: {args.response_file}")
     print()
 
@@ -148,14 +125,16 @@ Examples:
         if zendesk_path.exists():
             print("Calculating impact score from Zendesk PDF...")
 
-            # Extract Zendesk ticket ID from PDF
             from universal_ticket_parser import UniversalTicketParser
-            parser = UniversalTicketParser(str(zendesk_path))
-            zendesk_data = parser.parse()
+            from intelligent_estimator import IntelligentImpactEstimator
+
+            # Extract Zendesk ticket ID from PDF
+            with UniversalTicketParser(str(zendesk_path)) as parser:
+                zendesk_data = parser.parse()
             zendesk_id = zendesk_data.get('ticket_id', 'Unknown')
 
-            # Calculate impact score
-            estimator = IntelligentImpactEstimator(str(zendesk_path))
+            # Calculate impact score (reuse the parsed PDF instead of re-extracting it)
+            estimator = IntelligentImpactEstimator(str(zendesk_path), ticket_data=zendesk_data)
             estimator.load_data()
             ticket_info = estimator.extract_ticket_info()
             components = estimator.estimate_all_components()
@@ -177,6 +156,9 @@ Examples:
             zendesk_id = match.group(1)
 
     # Create Jira ticket data
+    from jira_creator import JiraCreator, JiraTicketData
+    from label_extractor import extract_labels
+
     creator = JiraCreator()
 
     # Auto-detect project if not explicitly overridden
@@ -238,20 +220,11 @@ Examples:
 
     # Override priority based on impact score if available
     if final_score > 0:
-        if final_score >= 90:
-            jira_data.priority = 'Highest'
-        elif final_score >= 70:
-            jira_data.priority = 'High'
-        elif final_score >= 50:
-            jira_data.priority = 'Medium'
-        elif final_score >= 30:
-            jira_data.priority = 'Low'
-        else:
-            jira_data.priority = 'Lowest'
+        jira_data.priority = PRIORITY_LEVELS[bisect.bisect_right(PRIORITY_THRESHOLDS, final_score)]
 
-    print("-"*80)
+    print(_DASH)
     print("JIRA TICKET DATA")
-    print("-"*80)
+    print(_DASH)
     print(f"Project: {jira_data.project}")
     print(f"Issue Type: {jira_data.issue_type}")
     print(f"Summary: {jira_data.summary}")
@@ -283,8 +256,7 @@ Examples:
         )
 
         markdown_file = output_file if args.format == 'markdown' else output_file.with_suffix('.md')
-        with open(markdown_file, 'w') as f:
-            f.write(markdown_content)
+        markdown_file.write_text(markdown_content)
         print(f"✓ Markdown file saved to {markdown_file}")
 
     # Save JSON format
@@ -303,20 +275,13 @@ Examples:
         }
 
         json_file = output_file if args.format == 'json' else output_file.with_suffix('.json')
-        with open(json_file, 'w') as f:
-            json.dump(ticket_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            json_file.write_bytes(orjson.dumps(ticket_data, option=orjson.OPT_INDENT_2))
+        else:
+            json_file.write_text(json.dumps(ticket_data, indent=2))
         print(f"✓ JSON data saved to {json_file}")
 
-    print()
-    print("="*80)
-    print("NEXT STEPS")
-    print("="*80)
-    print("1. Review the generated markdown file")
-    print("2. Copy and paste the markdown content into Jira")
-    print("3. Verify all fields are correctly populated")
-    print("4. Link any related tickets as needed")
-    print()
-    print("="*80)
+    sys.stdout.write(NEXT_STEPS)
 
 
 if __name__ == "__main__":
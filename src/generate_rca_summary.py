@@ -17,7 +17,7 @@ from pathlib import Path
 from typing import List, Dict
 from jira_creator import JiraCreator
 from intelligent_estimator import IntelligentImpactEstimator
-from universal_ticket_parser import UniversalTicketParser
+from universal_ticket_parser import parse_ticket_file
 
 
 class RCASummaryGenerator:
@@ -55,12 +55,11 @@ class RCASummaryGenerator:
     def _analyze_zendesk_ticket(self, pdf_path: str) -> Dict:
         """Analyze a single Zendesk ticket PDF."""
         try:
-            # Parse the ticket
-            parser = UniversalTicketParser(pdf_path)
-            ticket_data = parser.parse()
+            # Parse the ticket (memoized per file, so repeated PDFs are read once)
+            ticket_data = parse_ticket_file(pdf_path)
             
-            # Calculate impact score
-            estimator = IntelligentImpactEstimator(pdf_path)
+            # Calculate impact score (reuse the parsed PDF instead of re-extracting it)
+            estimator = IntelligentImpactEstimator(pdf_path, ticket_data=ticket_data)
             estimator.load_data()
             ticket_info = estimator.extract_ticket_info()
             components = estimator.estimate_all_components()
@@ -92,8 +91,7 @@ class RCASummaryGenerator:
         """Analyze a single Jira bug PDF."""
         try:
             # Parse the bug
-            parser = UniversalTicketParser(pdf_path)
-            bug_data = parser.parse()
+            bug_data = parse_ticket_file(pdf_path)
             
             # Extract key information
             return {
@@ -126,18 +126,22 @@ class IntelligentImpactEstimator:
     RCA_KEYWORDS = ['rca', 'root cause', 'action item', 'post mortem', 'postmortem']
     
     def __init__(self, file_path: str, manual_arr: Optional[str] = None,
-                 rca_jira_exists: Optional[bool] = None):
+                 rca_jira_exists: Optional[bool] = None,
+                 ticket_data: Optional[Dict] = None):
         """Initialize with path to ticket export (PDF/Excel/XML/Word).
 
         Args:
             rca_jira_exists: Pre-set the RCA Jira answer to skip the interactive
                 prompt.  True → 8 points, False → 0 points, None → ask at
                 runtime (default).
+            ticket_data: Dict already returned by UniversalTicketParser.parse()
+                for this file (PDF/XML/DOCX).  Pass it to skip re-extraction
+                in load_data().
         """
         self.file_path = Path(file_path)
         self.file_ext = self.file_path.suffix.lower()
         self.df = None
-        self.ticket_data = {}
+        self.ticket_data = ticket_data or {}
         self.manual_arr = manual_arr  # User-provided ARR override
         self.rca_jira_exists = rca_jira_exists  # None = ask interactively
 
@@ -149,8 +153,11 @@ class IntelligentImpactEstimator:
                 if not UNIVERSAL_PARSER_AVAILABLE:
                     raise ImportError("universal_ticket_parser module required for non-Excel formats")
 
-                print(f"✓ Parsing {self.file_ext.upper()} file: {self.file_path}")
-                self.ticket_data = parse_ticket_file(self.file_path)
+                if self.ticket_data:
+                    print(f"✓ Using pre-parsed {self.file_ext.upper()} data: {self.file_path}")
+                else:
+                    print(f"✓ Parsing {self.file_ext.upper()} file: {self.file_path}")
+                    self.ticket_data = parse_ticket_file(self.file_path)
                 print(f"  Source: {self.ticket_data.get('source', 'unknown').upper()}")
                 print(f"  Ticket ID: {self.ticket_data.get('issue_key') or self.ticket_data.get('ticket_id')}")
                 return self.ticket_data
@@ -10,21 +10,27 @@ Usage:
     python jira_creator.py --create-rca --customer "Customer Name" --date "10/25/25"
 """
 
+import io
 import sys
 import re
 import argparse
+import bisect
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 
 # Import existing modules
-from intelligent_estimator import IntelligentImpactEstimator
-from universal_ticket_parser import UniversalTicketParser
-from impact_score_calculator import ImpactScoreCalculator, ImpactScoreComponents
 from label_extractor import extract_labels
 
+# intelligent_estimator and universal_ticket_parser pull in the PDF/pandas
+# stack, so they are imported inside the methods that parse tickets; --help
+# and RCA creation without a bug PDF don't pay for them
+
 # Optional: Claude AI for intelligent description generation
 try:
     from claude_analyzer import ClaudeAnalyzer
@@ -32,8 +38,55 @@ try:
 except ImportError:
     CLAUDE_AVAILABLE = False
 
+# Optional: faster JSON serialization (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# CLI report banners
+SEP = "=" * 80
+RCA_HEADER = f"\n{SEP}\nRCA TICKET DATA\n{SEP}\n"
+BUG_HEADER = f"\n{SEP}\nBUG TICKET DATA\n{SEP}\n"
+SUGGESTIONS_HEADER = f"\n{SEP}\nJIRA FIELD SUGGESTIONS\n{SEP}\n"
+
+# CLI report bodies, rendered with str.format_map below the banner
+RCA_REPORT_TEMPLATE = """Project: {project}
+Issue Type: {issue_type}
+Summary: {summary}
+Priority: {priority}
+Labels: {labels}
+Custom Fields: {custom_fields}
+"""
+
+BUG_REPORT_TEMPLATE = """Project: {project}
+Issue Type: {issue_type}
+Summary: {summary}
+Priority: {priority}
+Severity: {severity}
+Labels: {labels}
+Custom Fields: {custom_fields}
+"""
+
+SUGGESTIONS_REPORT_TEMPLATE = """Zendesk ID: {zendesk_id}
+Summary: {summary}
+Impact Score: {final_score}
+Priority: {priority}
+Suggested Project: {suggested_project}
+Suggested Priority: {suggested_priority}
+Suggested Severity: {suggested_severity}
+Suggested Labels: {suggested_labels}
+Suggested Component: {suggested_component}
+
+Component Breakdown:
+"""
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JiraTicketData:
     """Data structure for Jira ticket creation."""
     project: str
@@ -84,9 +137,55 @@ class JiraCreator:
         'low': 'Low',
         'minimal': 'Lowest'
     }
+
+    # Impact score bucket thresholds (ascending, inclusive lower bounds) and the
+    # label of each bucket, looked up with _bucket()
+    SEVERITY_THRESHOLDS = (50, 70, 90)
+    SEVERITY_LEVELS = ('Low', 'Medium', 'High', 'Very High')
+    SUGGESTED_SEVERITY_THRESHOLDS = (50, 70)
+    SUGGESTED_SEVERITY_LEVELS = ('Low', 'Medium', 'High')
+    PRIORITY_LEVEL_THRESHOLDS = (30, 50, 70, 90)
+    PRIORITY_LEVELS = ('MINIMAL', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+    # Patterns for IDs/names mentioned in ticket descriptions (e.g. "cluster: c-123")
+    CLUSTER_ID_PATTERN = re.compile(r'cluster[:\s]+([^\s,]+)', re.IGNORECASE)
+    ACCOUNT_ID_PATTERN = re.compile(r'account[:\s]+([^\s,]+)', re.IGNORECASE)
+    CACHE_NAME_PATTERN = re.compile(r'cache name[:\s]+([^\s,]+)', re.IGNORECASE)
+    REGION_PATTERN = re.compile(r'region[:\s]+([^\s,]+)', re.IGNORECASE)
+
+    # Keyword scans over descriptions; each is a single findall, then the hits
+    # are checked in precedence order (first entry wins)
+    COMPONENT_KEYWORD_PATTERN = re.compile(r'dmc|redis|cluster', re.IGNORECASE)
+    COMPONENT_PRECEDENCE = (('dmc', 'DMC'), ('redis', 'Redis'), ('cluster', 'Cluster'))
+    ORGANIZATION_KEYWORD_PATTERN = re.compile(r'azure|aws|gcp', re.IGNORECASE)
+    ORGANIZATION_PRECEDENCE = (('azure', 'Azure'), ('aws', 'AWS'), ('gcp', 'GCP'))
+    INDICATOR_KEYWORD_PATTERN = re.compile(r'cpu|audit|connection|restart', re.IGNORECASE)
+
+    # All of the above in one pass for _extract_bug_jira_info. The lookahead makes
+    # every match zero-width so overlapping hits (e.g. "redis" inside a cluster
+    # name) are still found; no two alternatives can start at the same position.
+    BUG_DESCRIPTION_SCAN_PATTERN = re.compile(
+        r'(?=(?P<keyword>cpu|audit|connection|restart|dmc|redis|azure|aws|gcp)'
+        r'|(?P<cluster>cluster)(?:[:\s]+(?P<cluster_id>[^\s,]+))?'
+        r'|account[:\s]+(?P<account_id>[^\s,]+)'
+        r'|cache name[:\s]+(?P<cache_name>[^\s,]+)'
+        r'|region[:\s]+(?P<region>[^\s,]+))',
+        re.IGNORECASE
+    )
+
+    # Translation tables for RCA label / Slack channel names
+    LABEL_TRANSLATION = str.maketrans(' ', '_')      # "Acme Corp" -> "Acme_Corp"
+    CHANNEL_TRANSLATION = str.maketrans('', '', ' ')  # "acme corp" -> "acmecorp"
+    DATE_TRANSLATION = str.maketrans('', '', '/')     # "10/25/25" -> "102525"
+
+    # Claude results saved by ticket content, so re-submitted or duplicate
+    # tickets don't trigger another (paid) Claude call
+    CLAUDE_CACHE_FILE = 'output/claude_cache.json'
+    WHITESPACE_PATTERN = re.compile(r'\s+')
     
     def __init__(self, jira_url: str = None, username: str = None, api_token: str = None,
-                 claude_analyzer: Optional['ClaudeAnalyzer'] = None):
+                 claude_analyzer: Optional['ClaudeAnalyzer'] = None,
+                 claude_cache_file: Optional[str] = None):
         """
         Initialize Jira creator.
 
@@ -95,15 +194,19 @@ class JiraCreator:
             username: Jira username (for future API integration)
             api_token: Jira API token (for future API integration)
             claude_analyzer: Optional ClaudeAnalyzer for AI-powered description generation
+            claude_cache_file: JSON file caching Claude results (defaults to CLAUDE_CACHE_FILE)
         """
         self.jira_url = jira_url
         self.username = username
         self.api_token = api_token
         self.claude_analyzer = claude_analyzer
+        self.claude_cache_file = Path(claude_cache_file or self.CLAUDE_CACHE_FILE)
+        self._claude_cache = None  # Loaded on first use
         # TODO: Initialize Jira API client when ready
     
     def create_bug_from_zendesk(self, zendesk_file: str, project: str = 'RED',
-                                 use_claude: bool = None) -> JiraTicketData:
+                                 use_claude: bool = None,
+                                 rca_jira_exists: Optional[bool] = None) -> JiraTicketData:
         """
         Create a bug Jira ticket from Zendesk PDF.
 
@@ -112,22 +215,12 @@ class JiraCreator:
             project: Jira project key (RED, MOD, DOC, RDSC)
             use_claude: Whether to use Claude AI for description generation
                        (defaults to True if claude_analyzer is available)
+            rca_jira_exists: Whether a formal RCA Jira exists (None asks interactively)
 
         Returns:
             JiraTicketData object ready for creation
         """
-        print(f"Analyzing Zendesk ticket: {zendesk_file}")
-
-        # Parse Zendesk ticket
-        parser = UniversalTicketParser(zendesk_file)
-        zendesk_data = parser.parse()
-
-        # Calculate impact score
-        estimator = IntelligentImpactEstimator(zendesk_file)
-        estimator.load_data()
-        ticket_info = estimator.extract_ticket_info()
-        components = estimator.estimate_all_components()
-        base_score, final_score, priority = estimator.calculate_impact_score(components)
+        zendesk_data, scoring = self._analyze_zendesk_file(zendesk_file, rca_jira_exists)
 
         # Determine whether to use Claude
         if use_claude is None:
@@ -135,23 +228,193 @@ class JiraCreator:
 
         # Use Claude for summary and description if enabled
         if use_claude and self.claude_analyzer:
-            print("Using Claude AI to generate summary and description...")
             try:
-                summary, description = self.claude_analyzer.analyze_zendesk_ticket(
-                    zendesk_conversation=zendesk_data.get('description', ''),
-                    ticket_id=zendesk_data.get('ticket_id', 'Unknown'),
-                    customer=zendesk_data.get('customer_name', 'Unknown'),
-                    product=self._detect_product(zendesk_data.get('description', ''))
-                )
-
-                # Override zendesk_data with Claude-generated content
-                zendesk_data['summary'] = summary
-                zendesk_data['description'] = description
-                print(f"✓ Claude generated summary: {summary[:60]}...")
+                request = self._claude_request(zendesk_data)
+                cache_key = self._claude_cache_key(request)
+                cached = self._get_claude_cache().get(cache_key)
+                if cached:
+                    print("✓ Reusing cached Claude analysis (same ticket content seen before)")
+                    summary, description = cached['summary'], cached['description']
+                else:
+                    print("Using Claude AI to generate summary and description...")
+                    summary, description = self.claude_analyzer.analyze_zendesk_ticket(**request)
+                    self._save_claude_results({cache_key: (summary, description)})
+                self._apply_claude_result(zendesk_data, summary, description)
             except Exception as e:
                 print(f"⚠ Claude analysis failed ({e}), falling back to keyword-based extraction")
                 # Fall back to normal processing
 
+        return self._build_bug_ticket(zendesk_data, scoring, project)
+
+    def create_bugs_from_zendesk(self, zendesk_files: List[str], project: str = 'RED',
+                                  use_claude: bool = None,
+                                  rca_jira_exists: Optional[bool] = None) -> List[JiraTicketData]:
+        """
+        Create bug Jira tickets from several Zendesk PDFs.
+
+        Same as create_bug_from_zendesk per file, but the Claude summaries and
+        descriptions are requested in a single Message Batches API call.
+
+        Args:
+            zendesk_files: Paths to Zendesk PDFs
+            project: Jira project key (RED, MOD, DOC, RDSC)
+            use_claude: Whether to use Claude AI for description generation
+                       (defaults to True if claude_analyzer is available)
+            rca_jira_exists: Whether a formal RCA Jira exists, applied to every
+                             file (None asks interactively per file)
+
+        Returns:
+            List of JiraTicketData objects, in the order of zendesk_files
+        """
+        analyzed = [self._analyze_zendesk_file(zendesk_file, rca_jira_exists)
+                    for zendesk_file in zendesk_files]
+        return self._build_bug_tickets(analyzed, project, use_claude)
+
+    def create_bugs_from_zendesk_parallel(self, zendesk_files: List[str], project: str = 'RED',
+                                           use_claude: bool = None,
+                                           rca_jira_exists: Optional[bool] = None,
+                                           max_workers: Optional[int] = None) -> List[JiraTicketData]:
+        """
+        Create bug Jira tickets from several Zendesk PDFs, parsing and scoring in parallel.
+
+        PDF parsing and impact estimation run in separate processes (one file
+        per task); the Claude step is then batched as in create_bugs_from_zendesk.
+
+        Args:
+            zendesk_files: Paths to Zendesk PDFs
+            project: Jira project key (RED, MOD, DOC, RDSC)
+            use_claude: Whether to use Claude AI for description generation
+                       (defaults to True if claude_analyzer is available)
+            rca_jira_exists: Whether a formal RCA Jira exists, applied to every
+                             file.  Required: worker processes cannot prompt for it.
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            List of JiraTicketData objects, in the order of zendesk_files
+
+        Raises:
+            ValueError: If rca_jira_exists is None
+        """
+        if rca_jira_exists is None:
+            raise ValueError("rca_jira_exists must be True or False for parallel processing "
+                             "(worker processes cannot ask interactively)")
+
+        worker = partial(_analyze_zendesk_file, rca_jira_exists=rca_jira_exists)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            analyzed = list(executor.map(worker, zendesk_files))
+        return self._build_bug_tickets(analyzed, project, use_claude)
+
+    def _build_bug_tickets(self, analyzed: List[Tuple[Dict, Tuple]], project: str,
+                           use_claude: Optional[bool]) -> List[JiraTicketData]:
+        """Run the (batched) Claude step over analyzed tickets and map them to Jira fields."""
+        if use_claude is None:
+            use_claude = self.claude_analyzer is not None
+
+        if use_claude and self.claude_analyzer and analyzed:
+            requests = [self._claude_request(zendesk_data) for zendesk_data, _ in analyzed]
+            cache_keys = [self._claude_cache_key(request) for request in requests]
+            cache = self._get_claude_cache()
+            results = [(cache[key]['summary'], cache[key]['description']) if key in cache else None
+                       for key in cache_keys]
+
+            # Only send tickets without a cached result
+            pending = [index for index, result in enumerate(results) if result is None]
+            if len(pending) < len(results):
+                print(f"✓ Reusing cached Claude analysis for {len(results) - len(pending)} tickets")
+            if pending:
+                print(f"Using Claude AI to generate summaries and descriptions for {len(pending)} tickets (batch)...")
+                try:
+                    batch_results = self.claude_analyzer.analyze_zendesk_tickets(
+                        [requests[index] for index in pending]
+                    )
+                except Exception as e:
+                    print(f"⚠ Claude batch analysis failed ({e}), falling back to keyword-based extraction")
+                    batch_results = [None] * len(pending)
+
+                fresh = {}
+                for index, result in zip(pending, batch_results):
+                    results[index] = result
+                    if result:
+                        fresh[cache_keys[index]] = result
+                if fresh:
+                    self._save_claude_results(fresh)
+
+            for (zendesk_data, _), result in zip(analyzed, results):
+                if result:
+                    self._apply_claude_result(zendesk_data, *result)
+                else:
+                    print(f"⚠ No Claude result for ticket {zendesk_data.get('ticket_id', 'Unknown')}, "
+                          f"using keyword-based extraction")
+
+        return [self._build_bug_ticket(zendesk_data, scoring, project)
+                for zendesk_data, scoring in analyzed]
+
+    def _analyze_zendesk_file(self, zendesk_file: str,
+                              rca_jira_exists: Optional[bool] = None) -> Tuple[Dict, Tuple]:
+        """Parse a Zendesk PDF and score it; returns (zendesk_data, (components, final_score, priority))."""
+        from intelligent_estimator import IntelligentImpactEstimator
+        from universal_ticket_parser import parse_ticket_file
+
+        print(f"Analyzing Zendesk ticket: {zendesk_file}")
+
+        # Parse Zendesk ticket
+        zendesk_data = parse_ticket_file(zendesk_file)
+
+        # Calculate impact score (reusing the parsed data instead of re-extracting the PDF)
+        estimator = IntelligentImpactEstimator(zendesk_file, rca_jira_exists=rca_jira_exists,
+                                               ticket_data=dict(zendesk_data))
+        estimator.load_data()
+        ticket_info = estimator.extract_ticket_info()
+        components = estimator.estimate_all_components()
+        base_score, final_score, priority = estimator.calculate_impact_score(components)
+
+        return zendesk_data, (components, final_score, priority)
+
+    def _claude_request(self, zendesk_data: Dict) -> Dict:
+        """Build the ClaudeAnalyzer.analyze_zendesk_ticket arguments for a parsed ticket."""
+        return {
+            'zendesk_conversation': zendesk_data.get('description', ''),
+            'ticket_id': zendesk_data.get('ticket_id', 'Unknown'),
+            'customer': zendesk_data.get('customer_name', 'Unknown'),
+            'product': self._detect_product(zendesk_data.get('description', ''))
+        }
+
+    def _claude_cache_key(self, request: Dict) -> str:
+        """SHA-256 of the normalized (whitespace-collapsed, lowercased) ticket content."""
+        conversation = self.WHITESPACE_PATTERN.sub(' ', request['zendesk_conversation']).strip().lower()
+        key_text = f"{request['customer']}\n{request['product']}\n{conversation}"
+        return hashlib.sha256(key_text.encode('utf-8')).hexdigest()
+
+    def _get_claude_cache(self) -> Dict:
+        """Return the Claude result cache, loading it from disk on first use."""
+        if self._claude_cache is None:
+            try:
+                self._claude_cache = json.loads(self.claude_cache_file.read_text())
+            except (OSError, ValueError):
+                self._claude_cache = {}
+        return self._claude_cache
+
+    def _save_claude_results(self, results: Dict[str, Tuple[str, str]]):
+        """Add (summary, description) results to the cache and write it to disk."""
+        cache = self._get_claude_cache()
+        for cache_key, (summary, description) in results.items():
+            cache[cache_key] = {'summary': summary, 'description': description}
+        try:
+            self.claude_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.claude_cache_file.write_text(json.dumps(cache, indent=2))
+        except OSError as e:
+            print(f"⚠ Could not write Claude cache {self.claude_cache_file}: {e}")
+
+    def _apply_claude_result(self, zendesk_data: Dict, summary: str, description: str):
+        """Override zendesk_data with Claude-generated content."""
+        zendesk_data['summary'] = summary
+        zendesk_data['description'] = description
+        print(f"✓ Claude generated summary: {summary[:60]}...")
+
+    def _build_bug_ticket(self, zendesk_data: Dict, scoring: Tuple, project: str) -> JiraTicketData:
+        """Map an analyzed Zendesk ticket to bug Jira fields."""
+        components, final_score, priority = scoring
+
         # Auto-detect project from content if caller passed the default
         if project == 'RED':
             project = self._detect_project(
@@ -160,9 +423,7 @@ class JiraCreator:
             )
 
         # Map to Jira fields
-        jira_data = self._map_zendesk_to_jira(zendesk_data, components, final_score, priority, project)
-
-        return jira_data
+        return self._map_zendesk_to_jira(zendesk_data, components, final_score, priority, project)
     
     def create_rca_ticket(self, customer_name: str, date: str, 
                          zendesk_tickets: List[str] = None,
@@ -182,7 +443,7 @@ class JiraCreator:
             JiraTicketData object ready for creation
         """
         # Format customer name (replace spaces with underscores for labels)
-        account_name = customer_name.replace(' ', '_')
+        account_name = customer_name.translate(self.LABEL_TRANSLATION)
         
         # Auto-populate from bug Jira if provided
         auto_populated_data = {}
@@ -200,7 +461,8 @@ class JiraCreator:
             labels=[account_name],
             custom_fields={
                 'zendesk_tickets': zendesk_tickets or [],
-                'slack_channel': f"#prod-{date.replace('/', '')}-{customer_name.lower().replace(' ', '')}",
+                'slack_channel': f"#prod-{date.translate(self.DATE_TRANSLATION)}-"
+                                 f"{customer_name.lower().translate(self.CHANNEL_TRANSLATION)}",
                 'initial_root_cause': auto_populated_data.get('initial_root_cause', '<Add your initial RCA here>'),
                 'final_root_cause': auto_populated_data.get('final_root_cause', '<Add your final RCA and Conclusions here>'),
                 'action_items': auto_populated_data.get('action_items', []),
@@ -218,56 +480,85 @@ class JiraCreator:
     
     def _extract_bug_jira_info(self, bug_jira_file: str) -> Dict:
         """Extract information from bug Jira PDF to auto-populate RCA."""
+        from universal_ticket_parser import parse_ticket_file
+
         try:
             # Parse the bug Jira PDF
-            parser = UniversalTicketParser(bug_jira_file)
-            bug_data = parser.parse()
+            bug_data = parse_ticket_file(bug_jira_file)
             
             # Extract key information
             description = bug_data.get('description', '')
             summary = bug_data.get('summary', '')
             
-            # Extract cache info
-            cache_info = self._extract_cache_info(description)
+            # Scan the description once for keywords and IDs shared by all helpers
+            # (skipped for an empty description, e.g. parse failure or metadata-only PDF)
+            if description:
+                keywords, id_fields = self._scan_bug_description(description)
+            else:
+                keywords, id_fields = set(), {}
             
             # Generate initial root cause from bug description
-            initial_root_cause = self._generate_initial_root_cause(summary, description)
+            initial_root_cause = self._generate_initial_root_cause(summary, description, keywords)
             
             # Generate action items from bug description
-            action_items = self._generate_action_items(summary, description)
+            action_items = self._generate_action_items(summary, description, keywords)
             
             return {
                 'initial_root_cause': initial_root_cause,
                 'final_root_cause': '<Add your final RCA and Conclusions here>',
                 'action_items': action_items,
-                'cluster_id': self._extract_cluster_id(description),
-                'account_id': self._extract_account_id(description),
-                'affected_component': self._detect_component(description),
-                'environment': self._detect_organization(description),
-                'cache_name': cache_info.get('cache_name', ''),
-                'region': cache_info.get('region', ''),
+                'cluster_id': id_fields.get('cluster_id', ''),
+                'account_id': id_fields.get('account_id', ''),
+                'affected_component': self._detect_component(description, keywords),
+                'environment': self._detect_organization(description, keywords),
+                'cache_name': id_fields.get('cache_name', ''),
+                'region': id_fields.get('region', ''),
                 'bug_summary': summary,
-                'bug_description': description[:500] + '...' if len(description) > 500 else description
+                'bug_description': bug_data['preview']
             }
         except Exception as e:
             print(f"Warning: Could not extract bug Jira info: {e}")
             return {}
+
+    def _scan_bug_description(self, description: str) -> Tuple[set, Dict]:
+        """
+        Scan a bug description once for detection keywords and ID fields.
+
+        Returns:
+            Tuple of (lowercased keywords found, dict of the first cluster_id,
+            account_id, cache_name and region values found)
+        """
+        keywords = set()
+        id_fields = {}
+        for match in self.BUG_DESCRIPTION_SCAN_PATTERN.finditer(description):
+            keyword, cluster, *values = match.groups()
+            if keyword:
+                keywords.add(keyword.lower())
+            elif cluster:
+                keywords.add('cluster')
+            for name, value in zip(('cluster_id', 'account_id', 'cache_name', 'region'), values):
+                if value and name not in id_fields:
+                    id_fields[name] = value
+        return keywords, id_fields
     
-    def _generate_initial_root_cause(self, summary: str, description: str) -> str:
-        """Generate initial root cause from bug information."""
+    def _generate_initial_root_cause(self, summary: str, description: str,
+                                     indicators: Optional[set] = None) -> str:
+        """Generate initial root cause from bug information (indicators: pre-scanned keywords)."""
         if not summary and not description:
             return '<Add your initial RCA here>'
         
         # Extract key phrases that might indicate root cause
+        if indicators is None:
+            indicators = self._scan_keywords(self.INDICATOR_KEYWORD_PATTERN, description)
         root_cause_indicators = []
         
-        if 'cpu' in description.lower():
+        if 'cpu' in indicators:
             root_cause_indicators.append("High CPU utilization")
-        if 'audit' in description.lower():
+        if 'audit' in indicators:
             root_cause_indicators.append("Audit logging issues")
-        if 'connection' in description.lower():
+        if 'connection' in indicators:
             root_cause_indicators.append("Connection problems")
-        if 'restart' in description.lower():
+        if 'restart' in indicators:
             root_cause_indicators.append("Service restart required")
         
         if root_cause_indicators:
@@ -276,12 +567,18 @@ class JiraCreator:
         else:
             return f"Bug: {summary}. Root cause analysis needed."
     
-    def _generate_action_items(self, summary: str, description: str) -> List[Dict]:
-        """Generate suggested action items from bug information."""
+    def _generate_action_items(self, summary: str, description: str,
+                               indicators: Optional[set] = None) -> List[Dict]:
+        """Generate suggested action items from bug information (indicators: pre-scanned keywords)."""
+        # Nothing to go on: only the default action item applies
+        if not summary and not description:
+            indicators = set()
+        elif indicators is None:
+            indicators = self._scan_keywords(self.INDICATOR_KEYWORD_PATTERN, description)
         action_items = []
         
         # Common action items based on bug type
-        if 'cpu' in description.lower():
+        if 'cpu' in indicators:
             action_items.append({
                 'description': 'Investigate CPU utilization patterns',
                 'type': 'Investigate',
@@ -289,7 +586,7 @@ class JiraCreator:
                 'ticket': '<jira-ticket>'
             })
         
-        if 'audit' in description.lower():
+        if 'audit' in indicators:
             action_items.append({
                 'description': 'Review audit logging configuration',
                 'type': 'Investigate', 
@@ -297,7 +594,7 @@ class JiraCreator:
                 'ticket': '<jira-ticket>'
             })
         
-        if 'restart' in description.lower():
+        if 'restart' in indicators:
             action_items.append({
                 'description': 'Implement automatic recovery mechanisms',
                 'type': 'Prevent',
@@ -318,14 +615,12 @@ class JiraCreator:
     
     def _extract_cluster_id(self, description: str) -> str:
         """Extract cluster ID from description."""
-        import re
-        cluster_match = re.search(r'cluster[:\s]+([^\s,]+)', description, re.IGNORECASE)
+        cluster_match = self.CLUSTER_ID_PATTERN.search(description)
         return cluster_match.group(1) if cluster_match else ''
     
     def _extract_account_id(self, description: str) -> str:
         """Extract account ID from description."""
-        import re
-        account_match = re.search(r'account[:\s]+([^\s,]+)', description, re.IGNORECASE)
+        account_match = self.ACCOUNT_ID_PATTERN.search(description)
         return account_match.group(1) if account_match else ''
     
     def _map_zendesk_to_jira(self, zendesk_data: Dict, components: Dict, 
@@ -338,18 +633,11 @@ class JiraCreator:
         ticket_id = zendesk_data.get('ticket_id', 'Unknown')
         
         # Map severity based on impact score
-        if impact_score >= 90:
-            severity = 'Very High'
-        elif impact_score >= 70:
-            severity = 'High'
-        elif impact_score >= 50:
-            severity = 'Medium'
-        else:
-            severity = 'Low'
+        severity = self._bucket(impact_score, self.SEVERITY_THRESHOLDS, self.SEVERITY_LEVELS)
         
         # Extract keyword-based labels from ticket content
         labels = extract_labels(
-            summary=zendesk_data['summary'],
+            summary=summary,
             description=description,
             customer_name=zendesk_data.get('customer_name'),
             source='zendesk',
@@ -394,13 +682,12 @@ class JiraCreator:
         cache_info = {}
         
         # Look for cache name patterns
-        import re
-        cache_match = re.search(r'cache name[:\s]+([^\s,]+)', description, re.IGNORECASE)
+        cache_match = self.CACHE_NAME_PATTERN.search(description)
         if cache_match:
             cache_info['cache_name'] = cache_match.group(1)
         
         # Look for region patterns
-        region_match = re.search(r'region[:\s]+([^\s,]+)', description, re.IGNORECASE)
+        region_match = self.REGION_PATTERN.search(description)
         if region_match:
             cache_info['region'] = region_match.group(1)
         
@@ -419,6 +706,10 @@ class JiraCreator:
         re.IGNORECASE
     )
 
+    def _detect_product(self, description: str) -> str:
+        """Detect the Redis product a ticket is about (used in the Claude prompt)."""
+        return 'Redis Cloud' if 'redis cloud' in description.lower() else 'Redis Software'
+
     def _detect_project(self, summary: str, description: str) -> str:
         """Detect Jira project from ticket content, falling back to RED."""
         text = (summary + ' ' + description).lower()
@@ -554,31 +845,28 @@ class JiraCreator:
         }
         return mapping.get(name.lower(), name)
 
-    def _detect_component(self, description: str) -> str:
-        """Detect component from description."""
-        description_lower = description.lower()
-        
-        if 'dmc' in description_lower:
-            return 'DMC'
-        elif 'redis' in description_lower:
-            return 'Redis'
-        elif 'cluster' in description_lower:
-            return 'Cluster'
-        else:
-            return 'Unknown'
+    @staticmethod
+    def _scan_keywords(pattern: re.Pattern, text: str) -> set:
+        """Return the set of lowercased keywords of a pattern found in text (one pass)."""
+        return {match.lower() for match in pattern.findall(text)}
+
+    def _detect_component(self, description: str, keywords: Optional[set] = None) -> str:
+        """Detect component from description (keywords: pre-scanned keywords)."""
+        found = keywords if keywords is not None else \
+            self._scan_keywords(self.COMPONENT_KEYWORD_PATTERN, description)
+        for keyword, component in self.COMPONENT_PRECEDENCE:
+            if keyword in found:
+                return component
+        return 'Unknown'
     
-    def _detect_organization(self, description: str) -> str:
-        """Detect affected organization."""
-        description_lower = description.lower()
-        
-        if 'azure' in description_lower:
-            return 'Azure'
-        elif 'aws' in description_lower:
-            return 'AWS'
-        elif 'gcp' in description_lower:
-            return 'GCP'
-        else:
-            return 'Unknown'
+    def _detect_organization(self, description: str, keywords: Optional[set] = None) -> str:
+        """Detect affected organization (keywords: pre-scanned keywords)."""
+        found = keywords if keywords is not None else \
+            self._scan_keywords(self.ORGANIZATION_KEYWORD_PATTERN, description)
+        for keyword, organization in self.ORGANIZATION_PRECEDENCE:
+            if keyword in found:
+                return organization
+        return 'Unknown'
     
     def _format_description(self, description: str, zendesk_id: str, impact_score: float) -> str:
         """Format description with additional context."""
@@ -601,30 +889,29 @@ class JiraCreator:
         Returns:
             Formatted markdown string
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
 
         # Header section
         if ticket_type == "bug":
-            lines.append("# JIRA BUG TICKET")
+            write("# JIRA BUG TICKET\n")
         else:
-            lines.append("# JIRA RCA TICKET")
+            write("# JIRA RCA TICKET\n")
 
-        lines.append("")
-        lines.append(f"**PROJECT:** {jira_data.project}")
-        lines.append(f"**ISSUE TYPE:** {jira_data.issue_type}")
-        lines.append(f"**PRIORITY:** {self._map_priority_to_p_level(jira_data.priority)}")
+        write(f"\n**PROJECT:** {jira_data.project}\n"
+              f"**ISSUE TYPE:** {jira_data.issue_type}\n"
+              f"**PRIORITY:** {self._map_priority_to_p_level(jira_data.priority)}\n")
 
         # Add impact score if available
         if impact_score:
             priority_level = self._get_priority_level(impact_score)
-            lines.append(f"**IMPACT SCORE:** {int(impact_score)} points ({priority_level})")
+            write(f"**IMPACT SCORE:** {int(impact_score)} points ({priority_level})\n")
 
         # Add impact score breakdown if components available
         if components:
-            lines.append("")
-            lines.append("### Impact Score Breakdown")
-            lines.append("| Component | Score | Reason |")
-            lines.append("|-----------|-------|--------|")
+            write("\n### Impact Score Breakdown\n"
+                  "| Component | Score | Reason |\n"
+                  "|-----------|-------|--------|\n")
 
             # Define component display order and names
             component_display = [
@@ -641,86 +928,59 @@ class JiraCreator:
                     comp_data = components[comp_key]
                     score = comp_data.get('score', 0)
                     reason = comp_data.get('reason', 'Unknown')
-                    lines.append(f"| {comp_name} | {score}/{max_pts} | {reason} |")
-
-        lines.append("")
-
-        # Summary section
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(jira_data.summary or "[No summary available]")
-        lines.append("")
+                    write(f"| {comp_name} | {score}/{max_pts} | {reason} |\n")
 
-        # Description section
-        lines.append("## Description")
-        lines.append("")
-        lines.append(jira_data.description or "[No description available]")
-        lines.append("")
-
-        # Environment section
-        lines.append("## Environment")
-        lines.append("")
+        # Summary and description sections
+        write(f"\n## Summary\n\n{jira_data.summary or '[No summary available]'}\n"
+              f"\n## Description\n\n{jira_data.description or '[No description available]'}\n"
+              "\n## Environment\n\n")
 
         # Extract environment info from custom fields
-        if jira_data.custom_fields:
+        custom_fields = jira_data.custom_fields
+        if custom_fields:
             env_fields = {
-                'Product': jira_data.custom_fields.get('environment', 'Redis Software'),
-                'Version': jira_data.custom_fields.get('version', ''),
-                'Customer': jira_data.custom_fields.get('customer', ''),
-                'Cluster': jira_data.custom_fields.get('cluster_id', ''),
-                'Region': jira_data.custom_fields.get('region', '')
+                'Product': custom_fields.get('environment', 'Redis Software'),
+                'Version': custom_fields.get('version', ''),
+                'Customer': custom_fields.get('customer', ''),
+                'Cluster': custom_fields.get('cluster_id', ''),
+                'Region': custom_fields.get('region', '')
             }
 
             for key, value in env_fields.items():
                 if value:
-                    lines.append(f"- **{key}:** {value}")
-
-        lines.append("")
+                    write(f"- **{key}:** {value}\n")
 
         # Labels section
-        lines.append("## Labels")
-        lines.append("")
+        write("\n## Labels\n\n")
         if jira_data.labels:
-            lines.append(", ".join(jira_data.labels))
-        lines.append("")
+            write(", ".join(jira_data.labels) + "\n")
 
         # Related tickets section
-        lines.append("## Related Tickets")
-        lines.append("")
+        write("\n## Related Tickets\n\n")
         if zendesk_id:
-            lines.append(f"- **Zendesk:** #{zendesk_id}")
+            write(f"- **Zendesk:** #{zendesk_id}\n")
         if jira_data.linked_issues:
-            lines.append(f"- **Related:** {', '.join(jira_data.linked_issues)}")
-        lines.append("")
+            write(f"- **Related:** {', '.join(jira_data.linked_issues)}\n")
 
         # Attachments section
-        lines.append("## Attachments")
-        lines.append("")
+        write("\n## Attachments\n\n")
         if zendesk_id:
-            lines.append(f"- Zendesk PDF: redislabs.zendesk.com_tickets_{zendesk_id}_print.pdf")
-        lines.append("")
+            write(f"- Zendesk PDF: redislabs.zendesk.com_tickets_{zendesk_id}_print.pdf\n")
 
         # Components section
-        lines.append("## Components")
-        lines.append("")
-        if jira_data.custom_fields and jira_data.custom_fields.get('component'):
-            lines.append(jira_data.custom_fields['component'])
-        lines.append("")
+        write("\n## Components\n\n")
+        if custom_fields and custom_fields.get('component'):
+            write(custom_fields['component'] + "\n")
 
         # Affects versions section
-        lines.append("## Affects Versions")
-        lines.append("")
-        if jira_data.custom_fields and jira_data.custom_fields.get('version'):
-            lines.append(jira_data.custom_fields['version'])
-        lines.append("")
+        write("\n## Affects Versions\n\n")
+        if custom_fields and custom_fields.get('version'):
+            write(custom_fields['version'] + "\n")
 
         # Fix versions section
-        lines.append("## Fix Versions")
-        lines.append("")
-        lines.append("[To be determined by R&D]")
-        lines.append("")
+        write("\n## Fix Versions\n\n[To be determined by R&D]\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _map_priority_to_p_level(self, priority: str) -> str:
         """Map Jira priority to P-level designation."""
@@ -735,16 +995,12 @@ class JiraCreator:
 
     def _get_priority_level(self, impact_score: float) -> str:
         """Get priority level text from impact score."""
-        if impact_score >= 90:
-            return "CRITICAL"
-        elif impact_score >= 70:
-            return "HIGH"
-        elif impact_score >= 50:
-            return "MEDIUM"
-        elif impact_score >= 30:
-            return "LOW"
-        else:
-            return "MINIMAL"
+        return self._bucket(impact_score, self.PRIORITY_LEVEL_THRESHOLDS, self.PRIORITY_LEVELS)
+
+    @staticmethod
+    def _bucket(score: float, thresholds: Tuple, levels: Tuple) -> str:
+        """Return the label of the threshold bucket a score falls into."""
+        return levels[bisect.bisect_right(thresholds, score)]
     
     def _create_rca_description(self, customer_name: str, date: str, zendesk_tickets: List[str], auto_populated_data: Dict = None) -> str:
         """Create RCA description based on template with auto-populated data."""
@@ -753,76 +1009,83 @@ class JiraCreator:
         
         # Use auto-populated summary or default
         summary = auto_populated_data.get('bug_summary', '<Add the summary here.>')
-        description = f"**Summary:** {summary}\n\n"
+        parts = [f"**Summary:** {summary}\n\n"]
         
         # Add cluster and account info if available
         if auto_populated_data.get('cluster_id'):
-            description += f"**Cluster ID:** {auto_populated_data['cluster_id']}\n"
+            parts.append(f"**Cluster ID:** {auto_populated_data['cluster_id']}\n")
         if auto_populated_data.get('account_id'):
-            description += f"**Account ID:** {auto_populated_data['account_id']}\n"
+            parts.append(f"**Account ID:** {auto_populated_data['account_id']}\n")
         if auto_populated_data.get('cache_name'):
-            description += f"**Cache Name:** {auto_populated_data['cache_name']}\n"
+            parts.append(f"**Cache Name:** {auto_populated_data['cache_name']}\n")
         if auto_populated_data.get('region'):
-            description += f"**Region:** {auto_populated_data['region']}\n"
+            parts.append(f"**Region:** {auto_populated_data['region']}\n")
         
-        description += f"\n**Date and Time (UTC)**\n"
-        description += f"**Activity**\n"
-        description += f"MMM-DD-YYYY, HH:MM <What happened/what has been done>\n\n"
+        parts.append("\n**Date and Time (UTC)**\n"
+                     "**Activity**\n"
+                     "MMM-DD-YYYY, HH:MM <What happened/what has been done>\n\n")
         
         if zendesk_tickets:
-            description += f"**Related Zendesk Tickets:** {', '.join(zendesk_tickets)}\n\n"
+            parts.append(f"**Related Zendesk Tickets:** {', '.join(zendesk_tickets)}\n\n")
         
         # Use auto-populated initial root cause or default
         initial_rca = auto_populated_data.get('initial_root_cause', '<Add your initial RCA here>')
-        description += f"**Initial Root Cause:** {initial_rca}\n\n"
-        description += f"**Final Root Cause & Conclusions:** <Add your final RCA and Conclusions here>\n\n"
+        parts.append(f"**Initial Root Cause:** {initial_rca}\n\n"
+                     "**Final Root Cause & Conclusions:** <Add your final RCA and Conclusions here>\n\n")
         
-        # Add auto-generated action items
+        # Add auto-generated action items (or a placeholder row to fill in)
         action_items = auto_populated_data.get('action_items', [])
+        parts.append("**Action item(s):**\n"
+                     "After updating the table below, ensure the tickets are linked with the `relates to` type.\n\n"
+                     "| Description | Type | Owner | Ticket |\n"
+                     "|-------------|------|-------|--------|\n")
         if action_items:
-            description += f"**Action item(s):**\n"
-            description += f"After updating the table below, ensure the tickets are linked with the `relates to` type.\n\n"
-            description += f"| Description | Type | Owner | Ticket |\n"
-            description += f"|-------------|------|-------|--------|\n"
-            for item in action_items:
-                description += f"| {item['description']} | {item['type']} | {item['owner']} | {item['ticket']} |\n"
+            parts.append("".join(
+                f"| {item['description']} | {item['type']} | {item['owner']} | {item['ticket']} |\n"
+                for item in action_items
+            ))
         else:
-            description += f"**Action item(s):**\n"
-            description += f"After updating the table below, ensure the tickets are linked with the `relates to` type.\n\n"
-            description += f"| Description | Type | Owner | Ticket |\n"
-            description += f"|-------------|------|-------|--------|\n"
-            description += f"| <What is the AI about?> | Investigate or Prevent or Mitigate | @name | <jira-ticket> |\n"
+            parts.append("| <What is the AI about?> | Investigate or Prevent or Mitigate | @name | <jira-ticket> |\n")
         
-        return description
+        return ''.join(parts)
     
-    def suggest_jira_fields(self, zendesk_file: str) -> Dict:
+    def suggest_jira_fields(self, zendesk_file: str,
+                            rca_jira_exists: Optional[bool] = None) -> Dict:
         """
         Analyze Zendesk ticket and suggest Jira fields without creating ticket.
         
         Args:
             zendesk_file: Path to Zendesk PDF
+            rca_jira_exists: Whether a formal RCA Jira exists (None asks interactively)
             
         Returns:
             Dictionary with suggested Jira fields
         """
+        from intelligent_estimator import IntelligentImpactEstimator
+        from universal_ticket_parser import parse_ticket_file
+
         print(f"Analyzing Zendesk ticket for Jira field suggestions: {zendesk_file}")
         
         # Parse and analyze
-        parser = UniversalTicketParser(zendesk_file)
-        zendesk_data = parser.parse()
+        zendesk_data = parse_ticket_file(zendesk_file)
         
-        estimator = IntelligentImpactEstimator(zendesk_file)
+        estimator = IntelligentImpactEstimator(zendesk_file, rca_jira_exists=rca_jira_exists,
+                                               ticket_data=dict(zendesk_data))
         estimator.load_data()
         ticket_info = estimator.extract_ticket_info()
         components = estimator.estimate_all_components()
         base_score, final_score, priority = estimator.calculate_impact_score(components)
+        summary = zendesk_data.get('summary')
+        description = zendesk_data.get('description', '')
+        ticket_id = zendesk_data.get('ticket_id')
+        cache_info = self._extract_cache_info(description)
         
         # Create suggestions
         suggestions = {
             'ticket_info': {
-                'zendesk_id': zendesk_data.get('ticket_id'),
-                'summary': zendesk_data.get('summary'),
-                'description': zendesk_data.get('description', '')[:500] + '...' if len(zendesk_data.get('description', '')) > 500 else zendesk_data.get('description', '')
+                'zendesk_id': ticket_id,
+                'summary': summary,
+                'description': zendesk_data['preview']
             },
             'impact_analysis': {
                 'final_score': final_score,
@@ -838,21 +1101,19 @@ class JiraCreator:
                 }
             },
             'suggested_jira_fields': {
-                'project': self._detect_project(
-                zendesk_data.get('summary', ''),
-                zendesk_data.get('description', '')
-            ),
+                'project': self._detect_project(summary or '', description),
                 'issue_type': 'Bug',
                 'priority': self.PRIORITY_MAPPINGS.get(priority.lower(), 'Medium'),
-                'severity': 'High' if final_score >= 70 else 'Medium' if final_score >= 50 else 'Low',
+                'severity': self._bucket(final_score, self.SUGGESTED_SEVERITY_THRESHOLDS,
+                                         self.SUGGESTED_SEVERITY_LEVELS),
                 'labels': ['Support', 'Customer-Reported'],
-                'component': self._detect_component(zendesk_data.get('description', '')),
+                'component': self._detect_component(description),
                 'environment': 'Production',
                 'custom_fields': {
                     'impact_score': final_score,
-                    'zendesk_id': zendesk_data.get('ticket_id'),
-                    'cache_name': self._extract_cache_info(zendesk_data.get('description', '')).get('cache_name'),
-                    'region': self._extract_cache_info(zendesk_data.get('description', '')).get('region')
+                    'zendesk_id': ticket_id,
+                    'cache_name': cache_info.get('cache_name'),
+                    'region': cache_info.get('region')
                 }
             }
         }
@@ -860,7 +1121,124 @@ class JiraCreator:
         return suggestions
 
 
-def main():
+@lru_cache(maxsize=1)
+def get_creator() -> JiraCreator:
+    """Shared JiraCreator for CLI-style callers that run main() repeatedly in one process."""
+    return JiraCreator()
+
+
+def _analyze_zendesk_file(zendesk_file: str, rca_jira_exists: bool) -> Tuple[Dict, Tuple]:
+    """Process pool worker: parse and score one Zendesk PDF."""
+    return JiraCreator()._analyze_zendesk_file(zendesk_file, rca_jira_exists)
+
+
+# Write buffer for JSON output files: the stdlib encoder emits many small
+# chunks, which this coalesces into a few large writes
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+class TicketJSONEncoder(json.JSONEncoder):
+    """JSON encoder that serializes dataclasses (e.g. JiraTicketData) field by field."""
+
+    def default(self, o):
+        # Shallow field mapping; unlike dataclasses.asdict() nothing is deep-copied
+        if is_dataclass(o):
+            return {field.name: getattr(o, field.name) for field in fields(o)}
+        return super().default(o)
+
+
+def dumps_json(data) -> str:
+    """Return data as indented JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, cls=TicketJSONEncoder)
+
+
+def write_json(output_file: str, data, compact: bool = False):
+    """
+    Write data (dict or dataclass such as JiraTicketData) as JSON, using orjson when available.
+
+    Args:
+        output_file: Path of the JSON file to write
+        data: Dict, list or dataclass to serialize
+        compact: Write without indentation/whitespace (for machine consumers)
+    """
+    if ORJSON_AVAILABLE:
+        # orjson serializes dataclass instances natively, straight to UTF-8 bytes
+        option = None if compact else orjson.OPT_INDENT_2
+        Path(output_file).write_bytes(orjson.dumps(data, option=option))
+    else:
+        # json.dump streams the iterencode() chunks straight to the file; the
+        # output is ASCII (ensure_ascii), so no real encoding work is done
+        with open(output_file, 'w', encoding='ascii', buffering=OUTPUT_BUFFER_SIZE) as f:
+            if compact:
+                json.dump(data, f, separators=(',', ':'), cls=TicketJSONEncoder)
+            else:
+                json.dump(data, f, indent=2, cls=TicketJSONEncoder)
+
+
+def report_fields(ticket: JiraTicketData) -> Dict:
+    """Values for RCA_REPORT_TEMPLATE / BUG_REPORT_TEMPLATE."""
+    return {
+        'project': ticket.project,
+        'issue_type': ticket.issue_type,
+        'summary': ticket.summary,
+        'priority': ticket.priority,
+        'severity': ticket.severity,
+        'labels': ', '.join(ticket.labels) if ticket.labels else '',
+        'custom_fields': dumps_json(ticket.custom_fields),
+    }
+
+
+def write_rca_report(rca_data: JiraTicketData):
+    """Print the RCA ticket summary shown by the CLI."""
+    sys.stdout.write(RCA_HEADER + RCA_REPORT_TEMPLATE.format_map(report_fields(rca_data)))
+
+
+def write_bug_report(bug_data: JiraTicketData):
+    """Print the bug ticket summary shown by the CLI."""
+    sys.stdout.write(BUG_HEADER + BUG_REPORT_TEMPLATE.format_map(report_fields(bug_data)))
+
+
+def write_json_lines(output_file: str, records):
+    """
+    Write records as JSON Lines (one compact JSON object per line), using orjson when available.
+
+    Records are serialized and written one at a time, so consumers can read the
+    file incrementally and no combined array is ever built.
+    """
+    with open(output_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        for record in records:
+            if ORJSON_AVAILABLE:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            else:
+                line = json.dumps(record, separators=(',', ':'), cls=TicketJSONEncoder)
+                f.write(line.encode('ascii') + b'\n')
+
+
+def keyed_batch(tickets: List[JiraTicketData]) -> Dict:
+    """
+    Build the --batch-output document for several tickets.
+
+    The custom field names are written once under "_keys" (the union over all
+    tickets, in first-seen order); each record's custom_fields is then a list
+    of values in that order, with null for fields a ticket does not have.
+
+    Returns:
+        {"_keys": [...], "records": [...]}
+    """
+    keys = list(dict.fromkeys(key for ticket in tickets for key in ticket.custom_fields))
+    records = []
+    for ticket in tickets:
+        record = {field.name: getattr(ticket, field.name) for field in fields(ticket)}
+        record['custom_fields'] = [ticket.custom_fields.get(key) for key in keys]
+        records.append(record)
+    return {'_keys': keys, 'records': records}
+
+
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description='Create Jira tickets with impact scores',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -868,6 +1246,8 @@ def main():
 Examples:
   %(prog)s zendesk_ticket.pdf --type bug
   %(prog)s zendesk_ticket.pdf --suggest-only
+  %(prog)s --files ticket1.pdf ticket2.pdf ticket3.pdf --no-rca-jira-exists --output bugs.jsonl
+  %(prog)s --files ticket1.pdf ticket2.pdf ticket3.pdf --no-rca-jira-exists --batch-output bugs.json
   %(prog)s --create-rca --customer "Customer Name" --date "10/25/25"
         """
     )
@@ -878,6 +1258,13 @@ Examples:
         help='Path to Zendesk PDF file'
     )
     
+    parser.add_argument(
+        '--files',
+        nargs='+',
+        metavar='FILE',
+        help='Create bug tickets from several Zendesk PDFs (parsed in parallel)'
+    )
+    
     parser.add_argument(
         '--type',
         choices=['bug', 'rca'],
@@ -918,6 +1305,22 @@ Examples:
         help='Related bug Jira keys to link to RCA'
     )
     
+    rca_group = parser.add_mutually_exclusive_group()
+    rca_group.add_argument(
+        '--rca-jira-exists',
+        dest='rca_jira_exists',
+        action='store_true',
+        default=None,
+        help='A formal RCA Jira exists for the issue (skips the interactive question)'
+    )
+    rca_group.add_argument(
+        '--no-rca-jira-exists',
+        dest='rca_jira_exists',
+        action='store_false',
+        default=None,
+        help='No formal RCA Jira exists for the issue (skips the interactive question)'
+    )
+    
     parser.add_argument(
         '--project',
         choices=['RED', 'MOD', 'DOC', 'RDSC'],
@@ -927,18 +1330,37 @@ Examples:
     
     parser.add_argument(
         '--output',
-        help='Output file for ticket data (JSON format)'
+        help='Output file for ticket data (JSON format; JSON Lines with --files)'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write --output JSON without indentation (for scripts)'
+    )
     
-    creator = JiraCreator()
+    parser.add_argument(
+        '--batch-output',
+        metavar='FILE',
+        help='With --files: save all tickets as one JSON document with the '
+             'custom field names listed once under "_keys"'
+    )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    if args.batch_output and not args.files:
+        parser.error('--batch-output requires --files')
     
     if args.create_rca:
         if not args.customer or not args.date:
             print("Error: --customer and --date are required for RCA creation")
             sys.exit(1)
         
+        creator = get_creator()
         print("Creating RCA ticket...")
         rca_data = creator.create_rca_ticket(
             customer_name=args.customer,
@@ -947,88 +1369,75 @@ Examples:
             related_bugs=args.related_bugs
         )
         
-        print("\n" + "="*80)
-        print("RCA TICKET DATA")
-        print("="*80)
-        print(f"Project: {rca_data.project}")
-        print(f"Issue Type: {rca_data.issue_type}")
-        print(f"Summary: {rca_data.summary}")
-        print(f"Priority: {rca_data.priority}")
-        print(f"Labels: {', '.join(rca_data.labels)}")
-        print(f"Custom Fields: {json.dumps(rca_data.custom_fields, indent=2)}")
+        write_rca_report(rca_data)
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump({
-                    'project': rca_data.project,
-                    'issue_type': rca_data.issue_type,
-                    'summary': rca_data.summary,
-                    'description': rca_data.description,
-                    'priority': rca_data.priority,
-                    'severity': rca_data.severity,
-                    'labels': rca_data.labels,
-                    'custom_fields': rca_data.custom_fields,
-                    'linked_issues': rca_data.linked_issues
-                }, f, indent=2)
+            write_json(args.output, rca_data, compact=args.compact)
             print(f"\n✓ RCA ticket data saved to {args.output}")
     
     elif args.file:
+        creator = get_creator()
         if args.suggest_only:
             print("Analyzing Zendesk ticket for Jira field suggestions...")
-            suggestions = creator.suggest_jira_fields(args.file)
+            suggestions = creator.suggest_jira_fields(args.file, args.rca_jira_exists)
             
-            print("\n" + "="*80)
-            print("JIRA FIELD SUGGESTIONS")
-            print("="*80)
-            print(f"Zendesk ID: {suggestions['ticket_info']['zendesk_id']}")
-            print(f"Summary: {suggestions['ticket_info']['summary']}")
-            print(f"Impact Score: {suggestions['impact_analysis']['final_score']}")
-            print(f"Priority: {suggestions['impact_analysis']['priority']}")
-            print(f"Suggested Project: {suggestions['suggested_jira_fields']['project']}")
-            print(f"Suggested Priority: {suggestions['suggested_jira_fields']['priority']}")
-            print(f"Suggested Severity: {suggestions['suggested_jira_fields']['severity']}")
-            print(f"Suggested Labels: {', '.join(suggestions['suggested_jira_fields']['labels'])}")
-            print(f"Suggested Component: {suggestions['suggested_jira_fields']['component']}")
+            ticket_info = suggestions['ticket_info']
+            impact_analysis = suggestions['impact_analysis']
+            suggested = suggestions['suggested_jira_fields']
             
-            print("\nComponent Breakdown:")
-            for component, data in suggestions['impact_analysis']['components'].items():
-                print(f"  {component}: {data['score']} points - {data['reason']}")
+            report = SUGGESTIONS_REPORT_TEMPLATE.format_map({
+                'zendesk_id': ticket_info['zendesk_id'],
+                'summary': ticket_info['summary'],
+                'final_score': impact_analysis['final_score'],
+                'priority': impact_analysis['priority'],
+                'suggested_project': suggested['project'],
+                'suggested_priority': suggested['priority'],
+                'suggested_severity': suggested['severity'],
+                'suggested_labels': ', '.join(suggested['labels']),
+                'suggested_component': suggested['component'],
+            })
+            breakdown = "".join(
+                f"  {component}: {data['score']} points - {data['reason']}\n"
+                for component, data in impact_analysis['components'].items()
+            )
+            sys.stdout.write(SUGGESTIONS_HEADER + report + breakdown)
             
             if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(suggestions, f, indent=2)
+                write_json(args.output, suggestions, compact=args.compact)
                 print(f"\n✓ Suggestions saved to {args.output}")
         
         else:
             print("Creating bug Jira ticket from Zendesk...")
-            bug_data = creator.create_bug_from_zendesk(args.file, args.project)
+            bug_data = creator.create_bug_from_zendesk(args.file, args.project,
+                                                       rca_jira_exists=args.rca_jira_exists)
             
-            print("\n" + "="*80)
-            print("BUG TICKET DATA")
-            print("="*80)
-            print(f"Project: {bug_data.project}")
-            print(f"Issue Type: {bug_data.issue_type}")
-            print(f"Summary: {bug_data.summary}")
-            print(f"Priority: {bug_data.priority}")
-            print(f"Severity: {bug_data.severity}")
-            print(f"Labels: {', '.join(bug_data.labels)}")
-            print(f"Custom Fields: {json.dumps(bug_data.custom_fields, indent=2)}")
+            write_bug_report(bug_data)
             
             if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump({
-                        'project': bug_data.project,
-                        'issue_type': bug_data.issue_type,
-                        'summary': bug_data.summary,
-                        'description': bug_data.description,
-                        'priority': bug_data.priority,
-                        'severity': bug_data.severity,
-                        'labels': bug_data.labels,
-                        'custom_fields': bug_data.custom_fields,
-                        'linked_issues': bug_data.linked_issues
-                    }, f, indent=2)
+                write_json(args.output, bug_data, compact=args.compact)
                 print(f"\n✓ Bug ticket data saved to {args.output}")
     
+    elif args.files:
+        # The files are scored in worker processes, which cannot ask the RCA question
+        if args.rca_jira_exists is None:
+            parser.error('--files requires --rca-jira-exists or --no-rca-jira-exists')
+
+        creator = get_creator()
+        print(f"Creating bug Jira tickets from {len(args.files)} Zendesk files...")
+        bugs = creator.create_bugs_from_zendesk_parallel(args.files, args.project,
+                                                         rca_jira_exists=args.rca_jira_exists)
+        
+        for bug_data in bugs:
+            write_bug_report(bug_data)
+        
+        if args.output:
+            write_json_lines(args.output, bugs)
+            print(f"\n✓ {len(bugs)} bug tickets saved to {args.output} (JSON Lines)")
+        
+        if args.batch_output:
+            write_json(args.batch_output, keyed_batch(bugs), compact=args.compact)
+            print(f"\n✓ {len(bugs)} bug tickets saved to {args.batch_output}")
+    
     else:
         parser.print_help()
 
@@ -12,30 +12,30 @@ for use by the intelligent estimator.
 
 import re
 import json
+import zipfile
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-import pandas as pd
-
-# PDF support
-try:
-    import fitz  # PyMuPDF
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
-# Word document support
-try:
-    import docx
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-
-# XML support
-try:
-    from lxml import etree
-    XML_AVAILABLE = True
-except ImportError:
-    XML_AVAILABLE = False
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+# The parsing backends (pandas, PyMuPDF, lxml) are imported inside the methods
+# that use them, so e.g. parsing a PDF never loads pandas. Availability is
+# checked here without importing them
+PDF_AVAILABLE = importlib.util.find_spec('fitz') is not None  # PyMuPDF
+XML_AVAILABLE = importlib.util.find_spec('lxml') is not None  # XML and Word (.docx) support
+
+# Optional: faster Excel reading (pandas 2.2+ 'calamine' engine)
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+CALAMINE_MIN_PANDAS = (2, 2)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _pandas_version(pd) -> Tuple[int, int]:
+    """(major, minor) of the imported pandas, e.g. (2, 2) for '2.2.0rc1'."""
+    match = re.match(r'(\d+)\.(\d+)', pd.__version__)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
 
 
 class UniversalTicketParser:
@@ -50,6 +50,136 @@ class UniversalTicketParser:
     MIN_IMAGE_WIDTH = 500
     MIN_IMAGE_HEIGHT = 100
 
+    # Length of the description preview added to parsed data ('preview' key)
+    PREVIEW_LENGTH = 500
+
+    # Source detection (_is_zendesk_pdf): lowercase substrings
+    JIRA_INDICATORS = (
+        'project:', 'issue type:', 'fix versions:', 'affects versions:',
+        'resolution:', 'components:', 'sprint:'
+    )
+    ZENDESK_INDICATORS = (
+        'ticket #', 'requester', 'submitted', 'received via',
+        'sla package', 'zendesk'
+    )
+
+    # Precompiled patterns (compiled once at class creation, not per call)
+    # Zendesk ticket ID sources, in _extract_zendesk_ticket_id priority order
+    FILENAME_TICKET_PATTERN = re.compile(r'tickets?_(\d+)', re.IGNORECASE)
+    FILENAME_HASH_PATTERN = re.compile(r'^#?(\d{5,7})\b')
+    TICKET_URL_PATTERN = re.compile(r'zendesk\.com/tickets/(\d+)')
+    PRIMARY_TICKET_PATTERN = re.compile(r'#(\d{5,7})\s+[\w\s]+-')
+    TICKET_REFERENCE_PATTERN = re.compile(r'Ticket #(\d+)', re.IGNORECASE)
+    FILENAME_ID_PATTERN = re.compile(r'(\d{5,7})')
+
+    SUMMARY_LINE_PATTERN = re.compile(r'#\d{5,7}\s+(.+?)(?=\n|$)')
+    SUBMITTED_SUFFIX_PATTERN = re.compile(r'\s+Submitted$')
+
+    # "Field: value" patterns; the first group is the value. Each field is
+    # searched on its own: a combined alternation (even a label-only prefilter)
+    # measured 2-4x slower over long ticket text, and a field's match can
+    # contain the next field ("Requester: Bob Assignee: Al")
+    ZENDESK_FIELD_PATTERNS = {
+        'priority': re.compile(r'Priority:\s*(\w+)', re.IGNORECASE),
+        'status': re.compile(r'Status:\s*(\w+)', re.IGNORECASE),
+        'requester': re.compile(r'Requester:\s*(.+)', re.IGNORECASE),
+        'assignee': re.compile(r'Assignee:\s*(.+)', re.IGNORECASE),
+        'created': re.compile(r'Created:\s*(.+)', re.IGNORECASE),
+        'updated': re.compile(r'Updated:\s*(.+)', re.IGNORECASE),
+        'subject': re.compile(r'Subject:\s*(.+)', re.IGNORECASE),
+    }
+    JIRA_FIELD_PATTERNS = {
+        'issue_key': re.compile(r'Issue Key:\s*([A-Z]+-\d+)', re.IGNORECASE),
+        'summary': re.compile(r'Summary:\s*(.+)', re.IGNORECASE),
+        'priority': re.compile(r'Priority:\s*(\w+)', re.IGNORECASE),
+        'severity': re.compile(r'Severity:\s*(.+)', re.IGNORECASE),
+        'status': re.compile(r'Status:\s*(\w+)', re.IGNORECASE),
+        'assignee': re.compile(r'Assignee:\s*(.+)', re.IGNORECASE),
+        'reporter': re.compile(r'Reporter:\s*(.+)', re.IGNORECASE),
+        'rca': re.compile(r'RCA:\s*(.+)', re.IGNORECASE),
+    }
+
+    # Zendesk description cleanup
+    # Comment headers are "<name> <Mon> <d>, <yyyy> at <h>:<mm>". They are found
+    # by their timestamp, with a one-character lookbehind for the name: the
+    # original r'[\w\s]+' name prefix backtracked quadratically over long runs
+    # of words and whitespace (seconds on a 70 KB ticket)
+    PROBLEM_SUMMARY_PATTERN = re.compile(r'Problem Summary', re.IGNORECASE)
+    COMMENT_START_TIMESTAMP_PATTERN = re.compile(r'(?<=[\w\s]) \w+ \d+, \d{4} at \d+:\d+', re.IGNORECASE)
+    COMMENT_HEADER_PATTERN = re.compile(r'(?<=[\w\s]) \w+ \d+, \d{4} at \d+:\d+')
+    TICKET_LIST_PATTERN = re.compile(r'^#\d{5,7}$')
+    # Noise/metadata lines to skip. Literal prefixes and exact lines are checked
+    # with str.startswith / set membership; only the rest need the (fused) regex
+    SKIP_PREFIXES = (
+        'Problem Summary *SF',
+        'Focus Score',
+        'Ticket Location',
+        'Ticket Clusters',
+        'Redis Support Bot Agent',
+        'Analyzer Bot',
+        'File uploaded to SFTP',
+        'Parsed Logs',
+        'Health check',
+        'Total Open Tickets:',
+        'Organization Notes:',
+        '***',
+        'EOF',
+        'http://files.cs.redislabs',
+        'https://files.cs.redislabs',
+        'Support Software by Zendesk',
+        # NOTE: Keep "SLA Package:" and account info for ARR detection
+        # 'SLA Package:',  # REMOVED - needed for customer tier detection
+        # 'Account Manager:',  # REMOVED - may contain useful context
+        # 'Solution Architect'  # REMOVED - may contain useful context
+    )
+    SKIP_EXACT = frozenset({'Ticket ID', 'Status', 'Assignee', 'Subject'})
+    SKIP_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+        r'^Package.*successfully analyzed',
+        r'^\d+/\d+$',  # Page numbers
+        r'redislabs\.zendesk\.com',
+        r'^@\w+$',  # Mentions like @exazen
+        r'^\d{6}$',  # Standalone numbers
+    )))
+
+    TAGS_PATTERN = re.compile(r'Tags:\s*(.+)', re.IGNORECASE)
+    SLA_PACKAGE_PATTERN = re.compile(r'SLA Package:\s*(.+?)(?:\n|$)', re.IGNORECASE)
+    TAM_SUFFIX_PATTERN = re.compile(r'\s+TAM:.*', re.IGNORECASE)
+    VIP_PATTERN = re.compile(r'VIP\s+(?:Support|Package|Customer)', re.IGNORECASE)
+
+    # Jira XML elements read by _parse_xml
+    XML_FIELDS = ('key', 'summary', 'description', 'priority', 'status', 'assignee', 'labels')
+
+    # Word (.docx) reading: WordprocessingML element names, and the text that
+    # run children other than <w:t> stand for (as in python-docx Run.text)
+    WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+    WORD_RUN_SYMBOLS = {
+        WORD_NS + 'tab': '\t',
+        WORD_NS + 'ptab': '\t',
+        WORD_NS + 'cr': '\n',
+        WORD_NS + 'noBreakHyphen': '-',
+    }
+    OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+    # Jira PDF/Word text
+    JIRA_DESCRIPTION_PATTERN = re.compile(r'Description:\s*(.+?)(?=\n[A-Z][a-z]+:|$)', re.DOTALL | re.IGNORECASE)
+    LABELS_PATTERN = re.compile(r'Labels:\s*(.+)', re.IGNORECASE)
+    # Common customer field names in Jira, in priority order. Searched one by
+    # one: a single alternation would return the earliest label in the text
+    # rather than the highest-priority one (and measured slower anyway)
+    JIRA_CUSTOMER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Customer:\s*(.+)',
+        r'Account:\s*(.+)',
+        r'Organization:\s*(.+)',
+        r'Company:\s*(.+)',
+        r'Affected Organizations?:\s*(.+)',
+        r'Seen by Customers?:\s*(.+)'
+    ))
+    CUSTOMER_PLACEHOLDERS = frozenset({'None', 'N/A', '-', ''})
+    TITLE_ISSUE_KEY_PATTERN = re.compile(r'^\[?([A-Z]+-\d+)\]?', re.MULTILINE)
+    TITLE_SUMMARY_PATTERN = re.compile(r'\[([A-Z]+-\d+)\]\s+(.+?)\s+Created:', re.IGNORECASE | re.DOTALL)
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    TITLE_NOISE_PATTERN = re.compile(r'\s+(Updated|Status|Priority):.*$', re.IGNORECASE)
+
     def __init__(self, file_path: Union[str, Path]):
         """Initialize parser with file path."""
         self.file_path = Path(file_path)
@@ -58,9 +188,33 @@ class UniversalTicketParser:
         self.raw_text = ""
         self.ticket_data = {}
         self.extracted_images = []  # List of extracted image info
+        self._doc = None  # Open fitz.Document, shared by parse() and extract_images()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the PDF document if one is open."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def _open_pdf(self):
+        """Open the PDF on first use and reuse it for later text/image extraction."""
+        if self._doc is None:
+            import fitz  # PyMuPDF
+            self._doc = fitz.open(self.file_path)
+        return self._doc
 
     def parse(self) -> Dict:
-        """Parse the ticket file and return normalized data."""
+        """Parse the ticket file and return normalized data.
+
+        A PDF is left open for extract_images(); use the parser as a context
+        manager (or call close()) to release it.
+        """
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
@@ -76,6 +230,13 @@ class UniversalTicketParser:
         else:
             raise ValueError(f"Unsupported file format: {self.file_ext}")
 
+        # Truncated description for summaries/listings, computed once here
+        description = self.ticket_data.get('description') or ''
+        if len(description) > self.PREVIEW_LENGTH:
+            self.ticket_data['preview'] = description[:self.PREVIEW_LENGTH] + '...'
+        else:
+            self.ticket_data['preview'] = description
+
         return self.ticket_data
 
     def _parse_pdf(self) -> Dict:
@@ -83,14 +244,10 @@ class UniversalTicketParser:
         if not PDF_AVAILABLE:
             raise ImportError("PyMuPDF (pymupdf) required for PDF support. Install: pip install pymupdf")
 
-        # Extract text from PDF
-        doc = fitz.open(self.file_path)
-        self.raw_text = ""
-
-        for page in doc:
-            self.raw_text += page.get_text()
-
-        doc.close()
+        # Extract text from PDF, joining the pages once (repeated += recopies the
+        # text for every page). The document stays open for extract_images()
+        doc = self._open_pdf()
+        self.raw_text = ''.join([page.get_text("text") for page in doc])
 
         # Detect source type (Jira vs Zendesk)
         if self._is_zendesk_pdf():
@@ -108,18 +265,34 @@ class UniversalTicketParser:
         Returns:
             List of dicts with image info: {path, filename, width, height, page, description}
         """
+        self.extracted_images = list(self.iter_extracted_images(output_dir))
+        return self.extracted_images
+
+    def iter_extracted_images(self, output_dir: Optional[Union[str, Path]] = None) -> Iterator[Dict]:
+        """
+        Extract meaningful images from PDF one at a time (see extract_images).
+
+        Each image is saved and its info dict yielded before the next one is
+        decoded, so a consumer (e.g. uploading images for analysis) can work
+        on it while extraction continues. Does not set self.extracted_images.
+
+        Args:
+            output_dir: Directory to save images. If None, uses output/images_<ticket_id>/
+
+        Yields:
+            Dict with image info: {path, filename, width, height, page, description}
+        """
         if not PDF_AVAILABLE:
             raise ImportError("PyMuPDF (pymupdf) required for image extraction")
 
         if self.file_ext != '.pdf':
-            return []
+            return
 
         # Determine ticket ID for output folder
         ticket_id = self.ticket_data.get('ticket_id') or self.ticket_data.get('issue_key') or 'unknown'
         if ticket_id == 'unknown':
             # Try to extract from filename
-            import re
-            match = re.search(r'(\d{5,7})', self.file_path.name)
+            match = self.FILENAME_ID_PATTERN.search(self.file_path.name)
             if match:
                 ticket_id = match.group(1)
 
@@ -131,15 +304,20 @@ class UniversalTicketParser:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Extract images
-        doc = fitz.open(self.file_path)
-        extracted = []
+        # Extract images (reusing the document opened by parse(), if any)
+        doc = self._open_pdf()
 
         for page_num, page in enumerate(doc):
             images = page.get_images()
 
             for img_idx, img in enumerate(images):
                 xref = img[0]
+
+                # get_images() already reports width/height (img[2], img[3]),
+                # so small images are dropped without decoding them
+                if img[2] < self.MIN_IMAGE_WIDTH or img[3] < self.MIN_IMAGE_HEIGHT:
+                    continue
+
                 try:
                     base_image = doc.extract_image(xref)
                     width = base_image['width']
@@ -154,8 +332,7 @@ class UniversalTicketParser:
                     filename = f'page{page_num + 1}_img{img_idx + 1}_{width}x{height}.{ext}'
                     filepath = output_dir / filename
 
-                    with open(filepath, 'wb') as f:
-                        f.write(base_image['image'])
+                    filepath.write_bytes(base_image['image'])
 
                     # Store image info
                     img_info = {
@@ -167,15 +344,12 @@ class UniversalTicketParser:
                         'page': page_num + 1,
                         'description': ''  # To be filled by Claude analysis
                     }
-                    extracted.append(img_info)
 
                 except Exception as e:
                     # Skip images that can't be extracted
                     continue
 
-        doc.close()
-        self.extracted_images = extracted
-        return extracted
+                yield img_info
 
     def _is_zendesk_pdf(self) -> bool:
         """Detect if PDF is from Zendesk."""
@@ -184,32 +358,39 @@ class UniversalTicketParser:
         if 'zendesk' in filename_lower:
             return True
 
-        text_lower = self.raw_text.lower()
+        # SECOND: Check for zendesk.com URL in content. URLs are nearly always
+        # lowercase already, so try the raw text before making a lowercase copy
+        if 'zendesk.com' in self.raw_text:
+            return True
 
-        # SECOND: Check for zendesk.com URL in content
+        text_lower = self.raw_text.lower()
         if 'zendesk.com' in text_lower:
             return True
 
         # Check for strong Jira indicators first (to avoid false positives)
-        jira_indicators = [
-            'project:', 'issue type:', 'fix versions:', 'affects versions:',
-            'resolution:', 'components:', 'sprint:'
-        ]
-        jira_matches = sum(1 for indicator in jira_indicators if indicator in text_lower)
-
         # If we find 3+ Jira indicators, it's definitely Jira
-        if jira_matches >= 3:
+        if self._has_indicators(text_lower, self.JIRA_INDICATORS, 3):
             return False
 
         # Check for Zendesk-specific indicators (relaxed - now only need 2)
-        zendesk_indicators = [
-            'ticket #', 'requester', 'submitted', 'received via',
-            'sla package', 'zendesk'
-        ]
-        zendesk_matches = sum(1 for indicator in zendesk_indicators if indicator in text_lower)
-
         # If 2+ Zendesk indicators match, likely Zendesk
-        return zendesk_matches >= 2
+        return self._has_indicators(text_lower, self.ZENDESK_INDICATORS, 2)
+
+    @staticmethod
+    def _has_indicators(text_lower: str, indicators, needed: int) -> bool:
+        """
+        Check whether at least `needed` of the indicator substrings occur in text_lower.
+
+        Stops searching as soon as enough are found. Plain substring tests on the
+        lowercased text are much faster here than a case-insensitive regex.
+        """
+        found = 0
+        for indicator in indicators:
+            if indicator in text_lower:
+                found += 1
+                if found >= needed:
+                    return True
+        return False
 
     def _parse_zendesk_pdf(self) -> Dict:
         """Parse Zendesk PDF export."""
@@ -219,12 +400,12 @@ class UniversalTicketParser:
             'ticket_id': self._extract_zendesk_ticket_id(),
             'summary': self._extract_zendesk_summary(),
             'description': self._extract_zendesk_description(),
-            'priority': self._extract_zendesk_field(r'Priority:\s*(\w+)'),
-            'status': self._extract_zendesk_field(r'Status:\s*(\w+)'),
-            'requester': self._extract_zendesk_field(r'Requester:\s*(.+)'),
-            'assignee': self._extract_zendesk_field(r'Assignee:\s*(.+)'),
-            'created': self._extract_zendesk_field(r'Created:\s*(.+)'),
-            'updated': self._extract_zendesk_field(r'Updated:\s*(.+)'),
+            'priority': self._extract_zendesk_field('priority'),
+            'status': self._extract_zendesk_field('status'),
+            'requester': self._extract_zendesk_field('requester'),
+            'assignee': self._extract_zendesk_field('assignee'),
+            'created': self._extract_zendesk_field('created'),
+            'updated': self._extract_zendesk_field('updated'),
             'labels': self._extract_zendesk_tags(),
             'support_tier': self._extract_support_tier(),  # Extract support tier for ARR estimation
             'raw_text': self.raw_text,
@@ -247,28 +428,28 @@ class UniversalTicketParser:
         filename = self.file_path.name
 
         # Method 1: URL-derived filename (most reliable)
-        filename_match = re.search(r'tickets?_(\d+)', filename, re.IGNORECASE)
+        filename_match = self.FILENAME_TICKET_PATTERN.search(filename)
         if filename_match:
             return filename_match.group(1)
 
         # Method 2: Hash-prefix or bare numeric filename (#157521 - ..., 157521-...)
-        hash_match = re.search(r'^#?(\d{5,7})\b', filename)
+        hash_match = self.FILENAME_HASH_PATTERN.search(filename)
         if hash_match:
             return hash_match.group(1)
 
         # Method 3: Zendesk URL in PDF body (zendesk.com/tickets/157521)
-        url_match = re.search(r'zendesk\.com/tickets/(\d+)', self.raw_text)
+        url_match = self.TICKET_URL_PATTERN.search(self.raw_text)
         if url_match:
             return url_match.group(1)
 
-        # Method 4: Look for #XXXXXX pattern in first 2000 chars (primary ticket)
-        first_section = self.raw_text[:2000]
-        primary_match = re.search(r'#(\d{5,7})\s+[\w\s]+-', first_section)
+        # Method 4: Look for #XXXXXX pattern in first 2000 chars (primary ticket);
+        # endpos bounds the search without copying the prefix
+        primary_match = self.PRIMARY_TICKET_PATTERN.search(self.raw_text, 0, 2000)
         if primary_match:
             return primary_match.group(1)
 
         # Method 5: Fallback to "Ticket #" pattern anywhere
-        fallback_match = re.search(r'Ticket #(\d+)', self.raw_text, re.IGNORECASE)
+        fallback_match = self.TICKET_REFERENCE_PATTERN.search(self.raw_text)
         return fallback_match.group(1) if fallback_match else None
 
     def _extract_zendesk_summary(self) -> Optional[str]:
@@ -280,23 +461,23 @@ class UniversalTicketParser:
         2. Subject: field
         """
         # Method 1: Extract from first line (#TICKET_ID Customer - Summary)
-        first_line_match = re.search(r'#\d{5,7}\s+(.+?)(?=\n|$)', self.raw_text[:500])
+        first_line_match = self.SUMMARY_LINE_PATTERN.search(self.raw_text, 0, 500)
         if first_line_match:
             summary = first_line_match.group(1).strip()
             # Remove any trailing metadata
-            summary = re.sub(r'\s+Submitted$', '', summary)
+            summary = self.SUBMITTED_SUFFIX_PATTERN.sub('', summary)
             return summary
 
         # Method 2: Look for "Subject:" field
-        subject_match = self._extract_zendesk_field(r'Subject:\s*(.+)')
+        subject_match = self._extract_zendesk_field('subject')
         if subject_match:
             return subject_match
 
         return None
 
-    def _extract_zendesk_field(self, pattern: str) -> Optional[str]:
-        """Extract a field from Zendesk PDF using regex."""
-        match = re.search(pattern, self.raw_text, re.IGNORECASE)
+    def _extract_zendesk_field(self, field: str) -> Optional[str]:
+        """Extract a field from Zendesk PDF using its ZENDESK_FIELD_PATTERNS regex."""
+        match = self.ZENDESK_FIELD_PATTERNS[field].search(self.raw_text)
         return match.group(1).strip() if match else None
 
     def _extract_zendesk_description(self) -> str:
@@ -310,89 +491,65 @@ class UniversalTicketParser:
         # filtering out noise patterns
 
         # Find where comments start (after "Problem Summary" or first human name + timestamp)
-        start_match = re.search(r'(Problem Summary|[\w\s]+ \w+ \d+, \d{4} at \d+:\d+)', self.raw_text, re.IGNORECASE)
-        if not start_match:
+        start = self._find_comment_start()
+        if start is None:
             return self.raw_text[:1000]
 
-        # Extract from start position to end
-        content = self.raw_text[start_match.start():]
-        lines = content.split('\n')
-
-        # Patterns for noise/metadata to skip
-        skip_patterns = [
-            r'^Problem Summary \*SF',
-            r'^Focus Score',
-            r'^Ticket Location',
-            r'^Ticket Clusters',
-            r'^Redis Support Bot Agent',
-            r'^Analyzer Bot',
-            r'^File uploaded to SFTP',
-            r'^Package.*successfully analyzed',
-            r'^Parsed Logs',
-            r'^Health check',
-            r'^Total Open Tickets:',
-            r'^Organization Notes:',
-            r'^\*\*\*',
-            r'^EOF',
-            r'^Ticket ID$',
-            r'^Status$',
-            r'^Assignee$',
-            r'^Subject$',
-            r'^\d+/\d+$',  # Page numbers
-            r'redislabs\.zendesk\.com',
-            r'^https?://files\.cs\.redislabs',
-            r'^@\w+$',  # Mentions like @exazen
-            r'^\d{6}$',  # Standalone numbers
-            r'^Support Software by Zendesk',
-            # NOTE: Keep "SLA Package:" and account info for ARR detection
-            # r'SLA Package:',  # REMOVED - needed for customer tier detection
-            # r'Account Manager:',  # REMOVED - may contain useful context
-            # r'Solution Architect'  # REMOVED - may contain useful context
-        ]
+        # Split from start position to end. The sliced copy is not kept, so it is
+        # freed before the loop (lines stay split on '\n' only; splitlines() would
+        # also break on \r, \x0c, \u2028, ...)
+        lines = self.raw_text[start:].split('\n')
 
         cleaned_lines = []
         skip_next_lines = 0
         prev_blank = False
 
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
+        # Hot loop: bind the per-line lookups to locals once
+        append = cleaned_lines.append
+        skip_exact = self.SKIP_EXACT
+        skip_prefixes = self.SKIP_PREFIXES
+        skip_search = self.SKIP_PATTERN.search
+        ticket_list_match = self.TICKET_LIST_PATTERN.match
+        comment_header_search = self.COMMENT_HEADER_PATTERN.search
 
-            # Skip counted lines
+        for line in lines:
+            # Skip counted lines (before doing any work on them)
             if skip_next_lines > 0:
                 skip_next_lines -= 1
                 continue
 
+            line_stripped = line.strip()
+
             # Skip if matches noise pattern
-            if any(re.search(pattern, line_stripped) for pattern in skip_patterns):
+            if (line_stripped in skip_exact
+                    or line_stripped.startswith(skip_prefixes)
+                    or skip_search(line_stripped)):
                 # If this is a bot agent line, skip until next human comment
-                if 'Bot Agent' in line_stripped or 'Bot' in line_stripped:
+                if 'Bot' in line_stripped:
                     skip_next_lines = 10  # Skip next few lines
                 continue
 
             # Skip ticket list entries (#NNNNNN followed by status)
-            if re.match(r'^#\d{5,7}$', line_stripped):
+            if ticket_list_match(line_stripped):
                 skip_next_lines = 3  # Skip ticket list entry
                 continue
 
             # Keep human comments (name + timestamp)
-            if re.search(r'[\w\s]+ \w+ \d+, \d{4} at \d+:\d+', line_stripped):
+            if comment_header_search(line_stripped):
                 # Add separator before new comment
                 if cleaned_lines and cleaned_lines[-1] != '':
-                    cleaned_lines.append('')
-                    cleaned_lines.append(f'**{line_stripped}**')
-                    cleaned_lines.append('')
-                else:
-                    cleaned_lines.append(f'**{line_stripped}**')
-                    cleaned_lines.append('')
+                    append('')
+                append(f'**{line_stripped}**')
+                append('')
                 continue
 
             # Keep substantive content lines
-            if line_stripped and len(line_stripped) > 2:
-                cleaned_lines.append(line_stripped)
+            if len(line_stripped) > 2:
+                append(line_stripped)
                 prev_blank = False
             # Allow single blank line for paragraphs
             elif line_stripped == '' and not prev_blank and cleaned_lines:
-                cleaned_lines.append('')
+                append('')
                 prev_blank = True
 
         # Remove trailing blank lines
@@ -401,9 +558,38 @@ class UniversalTicketParser:
 
         return '\n'.join(cleaned_lines).strip() if cleaned_lines else self.raw_text[:1000]
 
+    def _find_comment_start(self) -> Optional[int]:
+        """
+        Find where the ticket conversation starts in raw_text.
+
+        Returns the same position as searching
+        r'(Problem Summary|[\w\s]+ \w+ \d+, \d{4} at \d+:\d+)' case-insensitively,
+        in linear time. A comment header match starts at the beginning of the run
+        of word/whitespace characters holding the first timestamp.
+
+        Returns:
+            Start offset, or None if there is neither marker
+        """
+        text = self.raw_text
+        candidates = []
+
+        summary_match = self.PROBLEM_SUMMARY_PATTERN.search(text)
+        if summary_match:
+            candidates.append(summary_match.start())
+
+        timestamp_match = self.COMMENT_START_TIMESTAMP_PATTERN.search(text)
+        if timestamp_match:
+            # Walk back over the name: isalnum/'_'/isspace is exactly [\w\s]
+            start = timestamp_match.start() - 1
+            while start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_' or text[start - 1].isspace()):
+                start -= 1
+            candidates.append(start)
+
+        return min(candidates) if candidates else None
+
     def _extract_zendesk_tags(self) -> List[str]:
         """Extract tags/labels from Zendesk PDF."""
-        tags_match = re.search(r'Tags:\s*(.+)', self.raw_text, re.IGNORECASE)
+        tags_match = self.TAGS_PATTERN.search(self.raw_text)
         if tags_match:
             tags_str = tags_match.group(1).strip()
             return [tag.strip() for tag in tags_str.split(',')]
@@ -421,15 +607,15 @@ class UniversalTicketParser:
         Returns the tier string (e.g., "Premium Enterprise") or None.
         """
         # Look for "SLA Package:" pattern in raw text
-        sla_match = re.search(r'SLA Package:\s*(.+?)(?:\n|$)', self.raw_text, re.IGNORECASE)
+        sla_match = self.SLA_PACKAGE_PATTERN.search(self.raw_text)
         if sla_match:
             tier = sla_match.group(1).strip()
             # Clean up any trailing metadata
-            tier = re.sub(r'\s+TAM:.*', '', tier, flags=re.IGNORECASE)
+            tier = self.TAM_SUFFIX_PATTERN.sub('', tier)
             return tier
 
         # Look for VIP support mentions
-        if re.search(r'VIP\s+(?:Support|Package|Customer)', self.raw_text, re.IGNORECASE):
+        if self.VIP_PATTERN.search(self.raw_text):
             return "VIP Support"
 
         return None
@@ -439,16 +625,16 @@ class UniversalTicketParser:
         self.source_type = 'jira'
         data = {
             'source': 'jira',
-            'issue_key': self._extract_jira_field(r'Issue Key:\s*([A-Z]+-\d+)') or self._extract_jira_issue_key_from_title(),
-            'summary': self._extract_jira_field(r'Summary:\s*(.+)') or self._extract_jira_summary_from_title(),
+            'issue_key': self._extract_jira_field('issue_key') or self._extract_jira_issue_key_from_title(),
+            'summary': self._extract_jira_field('summary') or self._extract_jira_summary_from_title(),
             'description': self._extract_jira_description(),
-            'priority': self._extract_jira_field(r'Priority:\s*(\w+)'),
-            'severity': self._extract_jira_field(r'Severity:\s*(.+)'),
-            'status': self._extract_jira_field(r'Status:\s*(\w+)'),
-            'assignee': self._extract_jira_field(r'Assignee:\s*(.+)'),
-            'reporter': self._extract_jira_field(r'Reporter:\s*(.+)'),
+            'priority': self._extract_jira_field('priority'),
+            'severity': self._extract_jira_field('severity'),
+            'status': self._extract_jira_field('status'),
+            'assignee': self._extract_jira_field('assignee'),
+            'reporter': self._extract_jira_field('reporter'),
             'labels': self._extract_jira_labels(),
-            'rca': self._extract_jira_field(r'RCA:\s*(.+)'),
+            'rca': self._extract_jira_field('rca'),
             'customer': self._extract_jira_customer(),
             'raw_text': self.raw_text,
             'extracted_images': []  # Will be populated by extract_images()
@@ -456,14 +642,14 @@ class UniversalTicketParser:
 
         return data
 
-    def _extract_jira_field(self, pattern: str) -> Optional[str]:
-        """Extract a field from Jira PDF using regex."""
-        match = re.search(pattern, self.raw_text, re.IGNORECASE)
+    def _extract_jira_field(self, field: str) -> Optional[str]:
+        """Extract a field from Jira PDF using its JIRA_FIELD_PATTERNS regex."""
+        match = self.JIRA_FIELD_PATTERNS[field].search(self.raw_text)
         return match.group(1).strip() if match else None
 
     def _extract_jira_description(self) -> str:
         """Extract description from Jira PDF."""
-        desc_match = re.search(r'Description:\s*(.+?)(?=\n[A-Z][a-z]+:|$)', self.raw_text, re.DOTALL | re.IGNORECASE)
+        desc_match = self.JIRA_DESCRIPTION_PATTERN.search(self.raw_text)
         if desc_match:
             return desc_match.group(1).strip()
 
@@ -471,7 +657,7 @@ class UniversalTicketParser:
 
     def _extract_jira_labels(self) -> List[str]:
         """Extract labels from Jira PDF."""
-        labels_match = re.search(r'Labels:\s*(.+)', self.raw_text, re.IGNORECASE)
+        labels_match = self.LABELS_PATTERN.search(self.raw_text)
         if labels_match:
             labels_str = labels_match.group(1).strip()
             return [label.strip() for label in labels_str.split(',')]
@@ -479,22 +665,12 @@ class UniversalTicketParser:
 
     def _extract_jira_customer(self) -> Optional[str]:
         """Extract customer name from Jira PDF."""
-        # Common customer field names in Jira
-        patterns = [
-            r'Customer:\s*(.+)',
-            r'Account:\s*(.+)',
-            r'Organization:\s*(.+)',
-            r'Company:\s*(.+)',
-            r'Affected Organizations?:\s*(.+)',
-            r'Seen by Customers?:\s*(.+)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE)
+        for pattern in self.JIRA_CUSTOMER_PATTERNS:
+            match = pattern.search(self.raw_text)
             if match:
                 customer = match.group(1).strip()
                 # Clean up common noise
-                if customer and customer not in ['None', 'N/A', '-', '']:
+                if customer not in self.CUSTOMER_PLACEHOLDERS:
                     return customer
 
         return None
@@ -505,7 +681,7 @@ class UniversalTicketParser:
         Format: [RED-174782] Title text Created: ...
         """
         # Match [KEY-NUMBER] at start of first line
-        match = re.search(r'^\[?([A-Z]+-\d+)\]?', self.raw_text, re.MULTILINE)
+        match = self.TITLE_ISSUE_KEY_PATTERN.search(self.raw_text)
         if match:
             return match.group(1).strip()
         return None
@@ -516,19 +692,26 @@ class UniversalTicketParser:
         Format: [RED-174782] Title text Created: ...
         """
         # Match text between [KEY-NUMBER] and 'Created:' (allow newlines in title)
-        match = re.search(r'\[([A-Z]+-\d+)\]\s+(.+?)\s+Created:', self.raw_text, re.IGNORECASE | re.DOTALL)
+        match = self.TITLE_SUMMARY_PATTERN.search(self.raw_text)
         if match:
             summary = match.group(2).strip()
             # Remove newlines and multiple spaces
-            summary = re.sub(r'\s+', ' ', summary)
+            summary = self.WHITESPACE_PATTERN.sub(' ', summary)
             # Clean up common noise (Updated:, Status:, etc.)
-            summary = re.sub(r'\s+(Updated|Status|Priority):.*$', '', summary, flags=re.IGNORECASE)
+            summary = self.TITLE_NOISE_PATTERN.sub('', summary)
             return summary
         return None
 
     def _parse_excel(self) -> Dict:
         """Parse Excel export (Jira batch or single ticket)."""
-        df = pd.read_excel(self.file_path)
+        import pandas as pd
+
+        # Only the header and two rows are needed: one row is a single ticket,
+        # more means a batch export. openpyxl is what pandas uses otherwise
+        read_kwargs = {'nrows': 2}
+        if CALAMINE_AVAILABLE and _pandas_version(pd) >= CALAMINE_MIN_PANDAS:
+            read_kwargs['engine'] = 'calamine'
+        df = pd.read_excel(self.file_path, **read_kwargs)
 
         # Check if single ticket or batch
         if len(df) == 1:
@@ -539,35 +722,49 @@ class UniversalTicketParser:
             # Batch export - return first ticket (or raise error)
             raise ValueError("Batch Excel exports not supported by this parser. Use calculate_jira_scores.py instead.")
 
-    def _normalize_excel_row(self, row: pd.Series) -> Dict:
+    def _normalize_excel_row(self, row: 'pd.Series') -> Dict:
         """Normalize Excel row to standard format."""
+        # Drop empty cells and lowercase the remaining column names once for
+        # all the lookups below
+        row = row.dropna()
+        columns = [(col.lower(), col) for col in row.index]
+
         # Common Jira Excel column names (case-insensitive)
         data = {
             'source': 'jira',
-            'issue_key': self._get_field(row, ['Issue key', 'Key', 'Jira']),
-            'summary': self._get_field(row, ['Summary', 'Title']),
-            'description': self._get_field(row, ['Description']),
-            'priority': self._get_field(row, ['Priority']),
-            'severity': self._get_field(row, ['Severity', 'Custom field (Severity)']),
-            'status': self._get_field(row, ['Status']),
-            'assignee': self._get_field(row, ['Assignee']),
-            'labels': self._get_field(row, ['Labels'], as_list=True),
-            'rca': self._get_field(row, ['RCA', 'Custom field (RCA)', 'Root Cause Analysis']),
-            'customer': self._get_field(row, ['Customer', 'Account', 'Organization']),
+            'issue_key': self._get_field(row, columns, ['Issue key', 'Key', 'Jira']),
+            'summary': self._get_field(row, columns, ['Summary', 'Title']),
+            'description': self._get_field(row, columns, ['Description']),
+            'priority': self._get_field(row, columns, ['Priority']),
+            'severity': self._get_field(row, columns, ['Severity', 'Custom field (Severity)']),
+            'status': self._get_field(row, columns, ['Status']),
+            'assignee': self._get_field(row, columns, ['Assignee']),
+            'labels': self._get_field(row, columns, ['Labels'], as_list=True),
+            'rca': self._get_field(row, columns, ['RCA', 'Custom field (RCA)', 'Root Cause Analysis']),
+            'customer': self._get_field(row, columns, ['Customer', 'Account', 'Organization']),
         }
 
         return data
 
-    def _get_field(self, row: pd.Series, field_names: List[str], as_list: bool = False) -> Optional[Union[str, List[str]]]:
-        """Get field value from Excel row (case-insensitive)."""
+    def _get_field(self, row: 'pd.Series', columns: List[Tuple[str, str]], field_names: List[str],
+                   as_list: bool = False) -> Optional[Union[str, List[str]]]:
+        """
+        Get field value from Excel row (case-insensitive).
+
+        Args:
+            row: Excel row, without empty cells
+            columns: (lowercased name, column name) pairs for row.index, in order
+            field_names: Candidate column names, tried in order (substring match)
+            as_list: Return the value split on commas
+        """
         for field in field_names:
-            for col in row.index:
-                if field.lower() in col.lower():
+            field_lower = field.lower()
+            for col_lower, col in columns:
+                if field_lower in col_lower:
                     value = row[col]
-                    if pd.notna(value):
-                        if as_list:
-                            return str(value).split(',') if isinstance(value, str) else [str(value)]
-                        return str(value)
+                    if as_list:
+                        return str(value).split(',') if isinstance(value, str) else [str(value)]
+                    return str(value)
 
         return [] if as_list else None
 
@@ -576,65 +773,143 @@ class UniversalTicketParser:
         if not XML_AVAILABLE:
             raise ImportError("lxml required for XML support. Install: pip install lxml")
 
-        tree = etree.parse(str(self.file_path))
-        root = tree.getroot()
+        fields = self._read_xml_fields()
 
         # Jira XML structure
         data = {
             'source': 'jira',
-            'issue_key': self._get_xml_field(root, 'key'),
-            'summary': self._get_xml_field(root, 'summary'),
-            'description': self._get_xml_field(root, 'description'),
-            'priority': self._get_xml_field(root, 'priority'),
-            'status': self._get_xml_field(root, 'status'),
-            'assignee': self._get_xml_field(root, 'assignee'),
-            'labels': self._get_xml_field(root, 'labels', as_list=True),
+            'issue_key': self._get_xml_field(fields, 'key'),
+            'summary': self._get_xml_field(fields, 'summary'),
+            'description': self._get_xml_field(fields, 'description'),
+            'priority': self._get_xml_field(fields, 'priority'),
+            'status': self._get_xml_field(fields, 'status'),
+            'assignee': self._get_xml_field(fields, 'assignee'),
+            'labels': self._get_xml_field(fields, 'labels', as_list=True),
         }
 
         return data
 
-    def _get_xml_field(self, root, field_name: str, as_list: bool = False) -> Optional[Union[str, List[str]]]:
-        """Extract field from XML."""
-        elem = root.find(f'.//{field_name}')
-        if elem is not None and elem.text:
+    def _read_xml_fields(self) -> Dict[str, Optional[str]]:
+        """
+        Read the text of the first element (document order, below the root) named in XML_FIELDS.
+
+        Streams the file with iterparse instead of building the whole tree,
+        frees elements once they are read and stops as soon as every field
+        has been found.
+        """
+        from lxml import etree
+
+        texts = {}
+        first = {}  # Field name -> first element with that name
+        with open(self.file_path, 'rb') as f:
+            for event, elem in etree.iterparse(f, events=('start', 'end'), tag=self.XML_FIELDS):
+                if event == 'start':
+                    if elem.tag not in first and elem.getparent() is not None:
+                        first[elem.tag] = elem
+                    continue
+
+                if first.get(elem.tag) is elem:
+                    texts[elem.tag] = elem.text
+                    if len(texts) == len(self.XML_FIELDS):
+                        break
+
+                # Free what has been read: this element and the siblings before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        return texts
+
+    def _get_xml_field(self, fields: Dict[str, Optional[str]], field_name: str,
+                       as_list: bool = False) -> Optional[Union[str, List[str]]]:
+        """Extract field from the texts read by _read_xml_fields."""
+        text = fields.get(field_name)
+        if text:
             if as_list:
-                return elem.text.split(',')
-            return elem.text.strip()
+                return text.split(',')
+            return text.strip()
         return [] if as_list else None
 
     def _parse_docx(self) -> Dict:
         """Parse Jira Word document export."""
-        if not DOCX_AVAILABLE:
-            raise ImportError("python-docx required for Word support. Install: pip install python-docx")
-
-        doc = docx.Document(self.file_path)
-
-        # Extract all text
-        full_text = []
-        for para in doc.paragraphs:
-            full_text.append(para.text)
+        if not XML_AVAILABLE:
+            raise ImportError("lxml required for Word support. Install: pip install lxml")
 
-        self.raw_text = '\n'.join(full_text)
+        self.raw_text = '\n'.join(self._read_docx_paragraphs())
 
         # Parse similar to PDF (look for field patterns)
         data = {
             'source': 'jira',
-            'issue_key': self._extract_jira_field(r'Issue Key:\s*([A-Z]+-\d+)'),
-            'summary': self._extract_jira_field(r'Summary:\s*(.+)'),
+            'issue_key': self._extract_jira_field('issue_key'),
+            'summary': self._extract_jira_field('summary'),
             'description': self._extract_jira_description(),
-            'priority': self._extract_jira_field(r'Priority:\s*(\w+)'),
-            'status': self._extract_jira_field(r'Status:\s*(\w+)'),
+            'priority': self._extract_jira_field('priority'),
+            'status': self._extract_jira_field('status'),
             'labels': self._extract_jira_labels(),
             'raw_text': self.raw_text
         }
 
         return data
 
+    def _read_docx_paragraphs(self) -> List[str]:
+        """
+        Read the text of the body paragraphs of a .docx file.
+
+        Reads the main document XML straight from the zip instead of building
+        the python-docx object model. The text matches python-docx's
+        Document.paragraphs: top-level paragraphs only, runs and hyperlink runs
+        joined, with tabs, line breaks and non-breaking hyphens translated.
+        """
+        from lxml import etree
+
+        w = self.WORD_NS
+        run_children = (w + 't', w + 'br', *self.WORD_RUN_SYMBOLS)
+
+        with zipfile.ZipFile(self.file_path) as archive:
+            document = archive.read(self._docx_document_part(archive))
+        root = etree.fromstring(document, etree.XMLParser(remove_blank_text=True, resolve_entities=False))
+        body = root.find(w + 'body')
+        if body is None:
+            return []
+
+        paragraphs = []
+        for paragraph in body.iterchildren(w + 'p'):
+            parts = []
+            for child in paragraph.iterchildren(w + 'r', w + 'hyperlink'):
+                runs = (child,) if child.tag == w + 'r' else child.iterchildren(w + 'r')
+                for run in runs:
+                    for elem in run.iterchildren(*run_children):
+                        if elem.tag == w + 't':
+                            parts.append(elem.text or '')
+                        elif elem.tag == w + 'br':
+                            # Line breaks only; page and column breaks have no text
+                            if elem.get(w + 'type', 'textWrapping') == 'textWrapping':
+                                parts.append('\n')
+                        else:
+                            parts.append(self.WORD_RUN_SYMBOLS[elem.tag])
+            paragraphs.append(''.join(parts))
+
+        return paragraphs
+
+    def _docx_document_part(self, archive: zipfile.ZipFile) -> str:
+        """Return the zip member name of the main document (usually word/document.xml)."""
+        from lxml import etree
+
+        rels = etree.fromstring(archive.read('_rels/.rels'))
+        for rel in rels:
+            if rel.get('Type') == self.OFFICE_DOCUMENT_REL:
+                return rel.get('Target').lstrip('/')
+        return 'word/document.xml'
+
 
 def parse_ticket_file(file_path: Union[str, Path]) -> Dict:
     """
     Convenience function to parse any supported ticket file.
 
+    Results are cached per file path and modification time, so parsing the
+    same unchanged export twice in one process (e.g. parser + estimator)
+    only extracts the text once. Each call returns a shallow copy.
+
     Args:
         file_path: Path to ticket export (PDF/Excel/XML/Word)
 
@@ -646,8 +921,18 @@ def parse_ticket_file(file_path: Union[str, Path]) -> Dict:
         >>> data = parse_ticket_file('zendesk_ticket_789.pdf')
         >>> data = parse_ticket_file('jira_export.xlsx')
     """
-    parser = UniversalTicketParser(file_path)
-    return parser.parse()
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    return dict(_parse_ticket_file_cached(str(path.resolve()), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _parse_ticket_file_cached(file_path: str, mtime_ns: int) -> Dict:
+    """Parse a ticket file; keyed on mtime so edited files are re-parsed."""
+    with UniversalTicketParser(file_path) as parser:
+        return parser.parse()
 
 
 if __name__ == '__main__':
@@ -680,24 +965,24 @@ Examples:
     args = arg_parser.parse_args()
 
     try:
-        parser = UniversalTicketParser(args.file)
-        data = parser.parse()
-
-        # Extract images if requested
-        if args.extract_images or args.images_only:
-            images = parser.extract_images()
-            data['extracted_images'] = images
-
-            if images:
-                print(f"Extracted {len(images)} images:", file=sys.stderr)
-                for img in images:
-                    print(f"  - {img['filename']} ({img['width']}x{img['height']}) from page {img['page']}", file=sys.stderr)
-            else:
-                print("No meaningful images found (min 500x100px)", file=sys.stderr)
+        with UniversalTicketParser(args.file) as parser:
+            data = parser.parse()
+
+            # Extract images if requested (reuses the PDF opened by parse())
+            if args.extract_images or args.images_only:
+                images = parser.extract_images()
+                data['extracted_images'] = images
+
+                if images:
+                    print(f"Extracted {len(images)} images:", file=sys.stderr)
+                    for img in images:
+                        print(f"  - {img['filename']} ({img['width']}x{img['height']}) from page {img['page']}", file=sys.stderr)
+                else:
+                    print("No meaningful images found (min 500x100px)", file=sys.stderr)
 
         if not args.images_only:
-            # Don't include raw_text in JSON output (too verbose)
-            output_data = {k: v for k, v in data.items() if k != 'raw_text'}
+            # Don't include raw_text (too verbose) or the derived preview in JSON output
+            output_data = {k: v for k, v in data.items() if k not in ('raw_text', 'preview')}
             print(json.dumps(output_data, indent=2))
 
     except Exception as e:
@@ -0,0 +1,51 @@
+"""End-to-end tests for claude_interactive.py --batch."""
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CLAUDE_INTERACTIVE = REPO_ROOT / 'src' / 'claude_interactive.py'
+SAMPLE_PDF = (REPO_ROOT / 'docs' / 'pdfs' / 'Support Tickets'
+              / 'redislabs.zendesk.com_tickets_146173_print.pdf')
+
+
+@unittest.skipUnless(importlib.util.find_spec('fitz'), 'PyMuPDF is required to parse the sample PDFs')
+@unittest.skipUnless(SAMPLE_PDF.exists(), 'sample Zendesk PDF not found')
+class BatchTest(unittest.TestCase):
+    def test_pdfs_sharing_a_ticket_id_get_their_own_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            batch_dir = tmp / 'pdfs'
+            batch_dir.mkdir()
+            shutil.copy(SAMPLE_PDF, batch_dir / 'first.pdf')
+            shutil.copy(SAMPLE_PDF, batch_dir / 'second.pdf')
+
+            result = subprocess.run(
+                [sys.executable, str(CLAUDE_INTERACTIVE), '--batch', str(batch_dir)],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                cwd=tmp,
+                timeout=300,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            output_files = sorted(path.name for path in (tmp / 'output').iterdir())
+
+        self.assertEqual(output_files, [
+            'claude_prompt_146173_first.txt',
+            'claude_prompt_146173_second.txt',
+            'claude_response_146173_first.txt',
+            'claude_response_146173_second.txt',
+        ])
+        self.assertIn('ticket #146173 is in 2 PDFs', result.stdout)
+        self.assertIn('Generated 0/2 prompts by ticket ID', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""End-to-end tests for the jira_creator.py command line."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+JIRA_CREATOR = REPO_ROOT / 'src' / 'jira_creator.py'
+SAMPLE_PDFS = sorted((REPO_ROOT / 'docs' / 'pdfs' / 'Support Tickets').glob('*.pdf'))
+
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    """Run jira_creator.py with stdin closed, so any interactive prompt fails."""
+    return subprocess.run(
+        [sys.executable, str(JIRA_CREATOR), *args],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=300,
+    )
+
+
+@unittest.skipUnless(importlib.util.find_spec('fitz') and importlib.util.find_spec('pandas'),
+                     'PyMuPDF and pandas are required to parse the sample PDFs')
+@unittest.skipUnless(SAMPLE_PDFS, 'sample Zendesk PDFs not found')
+class FilesOptionTest(unittest.TestCase):
+    def test_files_without_stdin(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / 'bugs.jsonl'
+            result = run_cli('--files', *map(str, SAMPLE_PDFS),
+                             '--no-rca-jira-exists', '--output', str(output))
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            lines = output.read_text(encoding='utf-8').splitlines()
+
+        self.assertEqual(len(lines), len(SAMPLE_PDFS))
+        for line in lines:
+            bug = json.loads(line)
+            self.assertEqual(bug['issue_type'], 'Bug')
+            self.assertTrue(bug['summary'])
+
+    def test_files_requires_rca_answer(self):
+        result = run_cli('--files', str(SAMPLE_PDFS[0]))
+
+        self.assertEqual(result.returncode, 2)
+        self.assertIn('--rca-jira-exists', result.stderr)
+
+
+class BatchOutputOptionTest(unittest.TestCase):
+    def test_batch_output_requires_files(self):
+        result = run_cli('ticket.pdf', '--batch-output', 'bugs.json')
+
+        self.assertEqual(result.returncode, 2)
+        self.assertIn('--batch-output requires --files', result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()